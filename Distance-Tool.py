@@ -1,44 +1,1181 @@
 import bpy
+import bmesh
+import hashlib
+import logging
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+import numpy as np
 from mathutils import Vector
-from bpy.types import Operator, Panel, PropertyGroup
-from bpy.props import PointerProperty, FloatProperty, StringProperty, FloatVectorProperty
+from mathutils.bvhtree import BVHTree
+from bpy.app.handlers import persistent
+from bpy.types import Operator, Panel, PropertyGroup, UIList
+from bpy.props import PointerProperty, FloatProperty, StringProperty, FloatVectorProperty, IntProperty, EnumProperty, BoolProperty, CollectionProperty
+from bpy_extras.io_utils import ExportHelper
+# Scripts run from the Text Editor do not have their folder on sys.path, so add it for the sibling modules below
+_script_dir = os.path.dirname(os.path.abspath(__file__))
+if _script_dir not in sys.path:
+    sys.path.insert(0, _script_dir)
+from distance_core import (
+    get_world_bounds, transform_points_bounds, gaps_from_bounds, neighbour_x_gaps, x_distance_matrix,
+    compute_distribution_shifts, iter_clearance_pairs, animated_bounds, solve_target_x, solve_gap_secant,
+    projected_extent, box_distances, shutdown_pool, iter_bounds_rows, write_report, shared_points_bounds,
+    triangle_edges, closest_segment_pair,
+)
+from tool_logging import logger, LOG_LEVELS, set_log_level, warn_once, timed_operator, get_timings, reset_timings, export_timings
 
-def get_bounding_box_x_distance(obj1, obj2):
-    """Calculate the X-axis distance from the right side of obj1 to the left side of obj2 using bounding boxes."""
+# Data version per mesh pointer, bumped by the depsgraph handler on geometry changes
+_mesh_versions = {}
+_mesh_version_counter = 0
+# Local-space convex hull vertices per mesh pointer: (version key, (k, 3) array)
+_hull_cache = {}
+# Hulls of evaluated meshes per object pointer, for objects with modifiers or shape keys: (mesh version, (k, 3) array)
+_evaluated_hull_cache = {}
+# World-space AABB per object pointer: (min, max), dropped when the depsgraph reports a change
+_bounds_cache = {}
+_bounds_stats = {"hits": 0, "misses": 0}
+# Instance placements grouped per owning object, and the resulting world bounds per (mode, owner pointer),
+# for one depsgraph evaluation; dropped on every update
+_instance_cache = {"depsgraph": None, "modes": {}, "bounds": {}}
+# World-space BVH trees per object pointer: (stamp, tree, world vertices, triangles, world AABB)
+_bvh_cache = {}
+# Live auto-adjust bookkeeping: last solve time and whether the next target update is our own write
+_live_state = {"last_solve": 0.0, "own_write": False}
+# Distance rule bookkeeping: objects changed since the last rule solve, and targets the solver itself moved
+_rules_state = {"dirty": set(), "own_writes": set()}
+# The latest background measurement; older jobs are cancelled when a new one starts
+_background = {"job": None}
+# Minimum seconds between live solves, roughly one per viewport redraw
+LIVE_SOLVE_INTERVAL = 1.0 / 60.0
+# Scene ID property holding measurements persisted in the .blend, and the most entries it keeps
+MEASUREMENT_STORE = "distance_tool_measurements"
+MEASUREMENT_STORE_LIMIT = 1024
+# Per-object fingerprint: 16 world matrix values, vertex count and a 16-byte hash of the coordinates as 8 16-bit words
+FINGERPRINT_SIZE = 25
+# Mesh part of the fingerprint per mesh pointer: (version key, (9,) array)
+_mesh_fingerprints = {}
+
+def validate_mesh_pair(obj1, obj2):
+    """Raise ValueError unless obj1 and obj2 are both meshes with vertex data."""
     if obj1.type != 'MESH' or obj2.type != 'MESH':
         raise ValueError("Both objects must be meshes")
     
     # Validate mesh data
     if not obj1.data or not obj2.data or len(obj1.data.vertices) == 0 or len(obj2.data.vertices) == 0:
         raise ValueError(f"Invalid mesh data for {obj1.name} (vertices: {len(obj1.data.vertices)}) or {obj2.name} (vertices: {len(obj2.data.vertices)})")
-    
-    # Check for unapplied transforms
+
+def is_instancer(obj):
+    """Return True if obj draws geometry through instances, such as a collection instance empty or a geometry nodes instancer."""
+    return obj.is_instancer or (obj.instance_type == 'COLLECTION' and obj.instance_collection is not None)
+
+def validate_measurable_pair(obj1, obj2):
+    """Raise ValueError unless obj1 and obj2 are meshes with vertex data or, when either instances geometry, meshes or instancers."""
+    if not (is_instancer(obj1) or is_instancer(obj2)):
+        validate_mesh_pair(obj1, obj2)
+        return
     for obj in (obj1, obj2):
-        if not all(abs(v - 1.0) < 1e-6 for v in obj.scale):
-            print(f"WARNING: {obj.name} has unapplied scale {obj.scale}. Apply transforms (Ctrl+A > Scale) for accurate results.")
-        if not all(abs(v) < 1e-6 for v in obj.rotation_euler):
-            print(f"WARNING: {obj.name} has unapplied rotation {obj.rotation_euler}. Apply transforms (Ctrl+A > Rotation) for accurate results.")
-    
-    # Get bounding box vertices in world space
-    matrix1 = obj1.matrix_world
-    matrix2 = obj2.matrix_world
-    
-    # Compute X-range for obj1 (Object 1)
-    bound_box1 = [matrix1 @ Vector(corner) for corner in obj1.bound_box]
-    x_coords1 = [v.x for v in bound_box1]
-    max_x1 = max(x_coords1)  # Right side of Object 1
+        if obj.type != 'MESH' and not is_instancer(obj):
+            raise ValueError(f"{obj.name} is neither a mesh nor an instancer")
+
+def get_bounding_box_gaps(obj1, obj2):
+    """Calculate the signed X, Y and Z distances from obj1 to obj2 and their Euclidean separation using bounding boxes."""
+    validate_mesh_pair(obj1, obj2)
     
-    # Compute X-range for obj2 (Object 2)
-    bound_box2 = [matrix2 @ Vector(corner) for corner in obj2.bound_box]
-    x_coords2 = [v.x for v in bound_box2]
-    min_x2 = min(x_coords2)  # Left side of Object 2
+    # Check for unapplied transforms, warning once per object and only when warnings are enabled
+    if logger.isEnabledFor(logging.WARNING):
+        for obj in (obj1, obj2):
+            if not all(abs(v - 1.0) < 1e-6 for v in obj.scale):
+                warn_once((obj.name, "scale"), "%s has unapplied scale %s. Apply transforms (Ctrl+A > Scale) for accurate results.", obj.name, tuple(obj.scale))
+            if not all(abs(v) < 1e-6 for v in obj.rotation_euler):
+                warn_once((obj.name, "rotation"), "%s has unapplied rotation %s. Apply transforms (Ctrl+A > Rotation) for accurate results.", obj.name, tuple(obj.rotation_euler))
     
-    # Calculate X-distance from right side of obj1 to left side of obj2
-    x_distance = min_x2 - max_x1
+    # Get bounding boxes in world space; all three axes come from the same transformed corners
+    mins, maxs = get_cached_world_bounds([obj1, obj2])
+    gaps, separation = gaps_from_bounds(mins[0], maxs[0], mins[1], maxs[1])
     
-    print(f"DEBUG: Bounding box X-ranges - Object 1 ({obj1.name}): Right X={max_x1:.4f}, "
-          f"Object 2 ({obj2.name}): Left X={min_x2:.4f}, X-distance: {x_distance:.4f}")
-    return x_distance
+    logger.debug("Bounding box X-ranges - Object 1 (%s): Right X=%.4f, Object 2 (%s): Left X=%.4f, X-distance: %.4f",
+                 obj1.name, maxs[0, 0], obj2.name, mins[1, 0], gaps[0])
+    return gaps, float(separation)
+
+def get_bounding_box_x_distance(obj1, obj2):
+    """Calculate the X-axis distance from the right side of obj1 to the left side of obj2 using bounding boxes."""
+    return float(get_bounding_box_gaps(obj1, obj2)[0][0])
+
+def get_cached_world_bounds(objects):
+    """Return world-space AABB (mins, maxs) for objects from the bounds cache, computing only the missing entries in one batch."""
+    n = len(objects)
+    mins = np.empty((n, 3))
+    maxs = np.empty((n, 3))
+    keys = [obj.as_pointer() for obj in objects]
+    missing = []
+    for i, key in enumerate(keys):
+        entry = _bounds_cache.get(key)
+        if entry is None:
+            missing.append(i)
+        else:
+            mins[i], maxs[i] = entry
+    _bounds_stats["hits"] += n - len(missing)
+    _bounds_stats["misses"] += len(missing)
+    if missing:
+        # A cold cache reads the whole source in bulk instead of object by object
+        source = objects if len(missing) == n else [objects[i] for i in missing]
+        new_mins, new_maxs = get_world_bounds(source)
+        mins[missing] = new_mins
+        maxs[missing] = new_maxs
+        for row, i in enumerate(missing):
+            _bounds_cache[keys[i]] = (new_mins[row], new_maxs[row])
+    return mins, maxs
+
+def get_bounds_cache_stats():
+    """Return the world bounds cache hit/miss counters and current size."""
+    return {"hits": _bounds_stats["hits"], "misses": _bounds_stats["misses"], "size": len(_bounds_cache)}
+
+def clear_distance_caches():
+    """Drop every cached bound, hull and BVH tree and reset the bounds cache counters."""
+    _bounds_cache.clear()
+    _hull_cache.clear()
+    _evaluated_hull_cache.clear()
+    _bvh_cache.clear()
+    _mesh_fingerprints.clear()
+    _instance_cache["depsgraph"] = None
+    _spatial_index.invalidate()
+    _bounds_stats["hits"] = 0
+    _bounds_stats["misses"] = 0
+
+def get_neighbour_x_distances(objects):
+    """Sort objects by their left side and return (order, gaps), where gaps[i] is the X-distance from objects[order[i]] to objects[order[i + 1]]."""
+    mins, maxs = get_cached_world_bounds(objects)
+    return neighbour_x_gaps(mins, maxs)
+
+def get_x_distance_matrix(objects):
+    """Return an (n, n) matrix whose [i, j] entry is the X-distance from the right side of objects[i] to the left side of objects[j]."""
+    mins, maxs = get_cached_world_bounds(objects)
+    return x_distance_matrix(mins, maxs)
+
+def iter_report_pairs(objects, source='NEIGHBOURS', clearance=0.0):
+    """Yield (i, j) index pairs into objects: X neighbours left to right, or every pair closer than clearance."""
+    if source == 'CLEARANCE':
+        mins, maxs = get_cached_world_bounds(objects)
+        return iter_clearance_pairs(mins, maxs, clearance)
+    order, _gaps = get_neighbour_x_distances(objects)
+    return zip(order[:-1].tolist(), order[1:].tolist())
+
+def iter_measurement_rows(objects, pairs, mode='BOUNDS'):
+    """Yield one report row (names, mode, per-axis gaps, separation, overlap flag) per (i, j) pair of objects.
+
+    Bounding box rows are measured a chunk of pairs at a time; EXACT rows go through measure_gaps, and pairs
+    that cannot be measured are skipped.
+    """
+    if mode == 'BOUNDS':
+        mins, maxs = get_cached_world_bounds(objects)
+        yield from iter_bounds_rows([obj.name for obj in objects], mins, maxs, pairs, mode)
+        return
+    for i, j, *_rest in pairs:
+        try:
+            gaps, separation = measure_gaps(objects[i], objects[j], mode)
+        except ValueError:
+            continue
+        yield objects[i].name, objects[j].name, mode, float(gaps[0]), float(gaps[1]), float(gaps[2]), separation, separation <= 0.0
+
+def export_measurements(objects, path, source='NEIGHBOURS', mode='BOUNDS', file_format='CSV', clearance=0.0):
+    """Stream measurement rows for objects to a CSV or JSON Lines file at path and return the number of rows written."""
+    return write_report(iter_measurement_rows(objects, iter_report_pairs(objects, source, clearance), mode), path, file_format)
+
+def shift_world_x(objects, shifts):
+    """Move objects along world X by shifts, writing every unparented object with one bulk read and set of bpy.data.objects."""
+    parented = np.array([obj.parent is not None for obj in objects], dtype=bool)
+    free = np.flatnonzero(~parented)
+    if len(free):
+        index, locations = _read_all_locations()
+        moved = [objects[int(i)] for i in free]
+        rows = np.array([index[obj.as_pointer()] for obj in moved], dtype=np.int64)
+        locations[rows, 0] += np.asarray(shifts, dtype=np.float64)[free]
+        _write_all_locations(locations, moved)
+    for i in np.flatnonzero(parented):
+        obj = objects[int(i)]
+        # Convert the world-space move into the parent's space
+        parent_matrix = (obj.parent.matrix_world @ obj.matrix_parent_inverse).to_3x3()
+        obj.location += parent_matrix.inverted() @ Vector((float(shifts[i]), 0.0, 0.0))
+
+def _evaluate_channel(obj, data_path, frames):
+    """Return a (len(frames), 3) array of a vector property over frames, from its F-Curves or its current value."""
+    values = np.tile(np.array(getattr(obj, data_path), dtype=np.float64), (len(frames), 1))
+    action = obj.animation_data.action if obj.animation_data else None
+    if action:
+        for index in range(3):
+            fcurve = action.fcurves.find(data_path, index=index)
+            if fcurve:
+                values[:, index] = [fcurve.evaluate(frame) for frame in frames]
+    return values
+
+def can_bake_from_fcurves(obj):
+    """Return True when obj's world bounds follow from its own F-Curves alone, so they can be evaluated without the depsgraph."""
+    if obj.parent or obj.constraints or obj.rotation_mode != 'XYZ':
+        return False
+    anim = obj.animation_data
+    if anim and (anim.drivers or anim.nla_tracks):
+        return False
+    # Only the active action at full strength replaces the channels with what its F-Curves evaluate to
+    if anim and (anim.action_blend_type != 'REPLACE' or anim.action_influence != 1.0):
+        return False
+    # Delta transforms are applied on top of the channels animated_bounds composes
+    if tuple(obj.delta_location) != (0.0, 0.0, 0.0) or tuple(obj.delta_rotation_euler) != (0.0, 0.0, 0.0):
+        return False
+    if tuple(obj.delta_scale) != (1.0, 1.0, 1.0):
+        return False
+    if anim and anim.action and any(fcurve.data_path.startswith("delta_") for fcurve in anim.action.fcurves):
+        return False
+    # Modifiers and shape keys may deform the bound box from frame to frame
+    if obj.type == 'MESH' and (obj.modifiers or obj.data.shape_keys):
+        return False
+    return True
+
+def get_animated_world_bounds(obj, frames):
+    """Return world-space (mins, maxs) of shape (len(frames), 3) for an object accepted by can_bake_from_fcurves."""
+    corners = np.array(obj.bound_box, dtype=np.float64)
+    location = _evaluate_channel(obj, "location", frames)
+    rotation = _evaluate_channel(obj, "rotation_euler", frames)
+    scale = _evaluate_channel(obj, "scale", frames)
+    return animated_bounds(corners, location, rotation, scale)
+
+def write_fcurve_samples(obj, data_path, index, frames, values):
+    """Replace obj's keyframes for data_path[index] within frames with one key per sample, filled in bulk.
+
+    The F-Curve and its keys outside frames are edited in place, so their interpolation, easing, handles
+    and modifiers survive the bake.
+    """
+    anim = obj.animation_data or obj.animation_data_create()
+    if anim.action is None:
+        anim.action = bpy.data.actions.new(f"{obj.name}Action")
+    fcurve = anim.action.fcurves.find(data_path, index=index)
+    if fcurve is None:
+        fcurve = anim.action.fcurves.new(data_path, index=index, action_group="Object Transforms")
+    points = fcurve.keyframe_points
+    existing = np.empty(len(points) * 2, dtype=np.float32)
+    points.foreach_get("co", existing)
+    existing = existing.reshape(-1, 2)
+    inside = (existing[:, 0] >= frames[0]) & (existing[:, 0] <= frames[-1])
+    # Removing back to front keeps the remaining indices valid; update() re-sorts and recalculates handles once at the end
+    for i in np.flatnonzero(inside)[::-1]:
+        points.remove(points[int(i)], fast=True)
+
+    samples = np.column_stack((np.asarray(frames, dtype=np.float64), values))
+    keys = np.concatenate((existing[~inside], samples))
+    points.add(len(samples))
+    points.foreach_set("co", keys.astype(np.float32).ravel())
+    fcurve.update()
+    return fcurve
+
+def get_collection_mesh_objects(collection):
+    """Return the mesh objects of a collection, keeping the bpy collection itself when it holds only meshes so bulk reads stay available."""
+    objects = collection.all_objects
+    meshes = [obj for obj in objects if obj.type == 'MESH']
+    return objects if len(meshes) == len(objects) else meshes
+
+class SweepIndex:
+    """Sorted sweep lists of world X intervals for directional nearest-neighbour queries in O(log n).
+
+    Entries are keyed by object pointer and refreshed lazily: the depsgraph handler marks changed objects
+    stale and the next query re-inserts only those. Renames and deletions report no update, so an entry that
+    no longer resolves to its object makes the query rebuild the index from the scene.
+    """
+
+    def __init__(self):
+        self.scene_name = None
+        self.names = {}    # pointer -> object name
+        self.bounds = {}   # pointer -> (min x, max x)
+        self.lefts = []    # sorted (min x, pointer)
+        self.rights = []   # sorted (max x, pointer)
+        self.stale = {}    # pointer -> object name
+
+    def invalidate(self):
+        self.scene_name = None
+
+    def mark_stale(self, key, name):
+        if self.scene_name is not None:
+            self.stale[key] = name
+
+    def build(self, scene):
+        objects = [obj for obj in scene.objects if obj.type == 'MESH']
+        mins, maxs = get_cached_world_bounds(objects)
+        keys = [obj.as_pointer() for obj in objects]
+        self.scene_name = scene.name
+        self.names = {key: obj.name for key, obj in zip(keys, objects)}
+        self.bounds = {key: (float(mins[i, 0]), float(maxs[i, 0])) for i, key in enumerate(keys)}
+        self.lefts = sorted((low, key) for key, (low, high) in self.bounds.items())
+        self.rights = sorted((high, key) for key, (low, high) in self.bounds.items())
+        self.stale = {}
+
+    def ensure(self, scene):
+        """Build the index for scene on first use and apply pending incremental updates."""
+        if self.scene_name != scene.name:
+            self.build(scene)
+            return
+        if not self.stale:
+            return
+        stale, self.stale = self.stale, {}
+        live = []
+        for key, name in stale.items():
+            self._remove(key)
+            obj = bpy.data.objects.get(name)
+            if obj and obj.as_pointer() == key and obj.type == 'MESH' and name in scene.objects:
+                live.append(obj)
+        if live:
+            mins, maxs = get_cached_world_bounds(live)
+            for i, obj in enumerate(live):
+                self._insert(obj.as_pointer(), obj.name, float(mins[i, 0]), float(maxs[i, 0]))
+
+    def _insert(self, key, name, low, high):
+        self.names[key] = name
+        self.bounds[key] = (low, high)
+        insort(self.lefts, (low, key))
+        insort(self.rights, (high, key))
+
+    def _remove(self, key):
+        self.names.pop(key, None)
+        bounds = self.bounds.pop(key, None)
+        if bounds is None:
+            return
+        del self.lefts[bisect_left(self.lefts, (bounds[0], key))]
+        del self.rights[bisect_left(self.rights, (bounds[1], key))]
+
+    def _resolve(self, key):
+        """Return the live object for key, or None after invalidating the index if it was deleted or renamed."""
+        obj = bpy.data.objects.get(self.names.get(key, ""))
+        if obj is None or obj.as_pointer() != key:
+            self.invalidate()
+            return None
+        return obj
+
+    def nearest_right(self, scene, obj):
+        """Return (object, gap) for the nearest mesh in scene starting at or right of obj's right side, or (None, None)."""
+        self.ensure(scene)
+        key = obj.as_pointer()
+        high = float(get_cached_world_bounds([obj])[1][0, 0])
+        i = bisect_left(self.lefts, (high,))
+        while i < len(self.lefts):
+            low, other = self.lefts[i]
+            if other != key:
+                found = self._resolve(other)
+                if found is None:
+                    # Rebuilt entries all resolve, so this searches again at most once
+                    return self.nearest_right(scene, obj)
+                return found, low - high
+            i += 1
+        return None, None
+
+    def nearest_left(self, scene, obj):
+        """Return (object, gap) for the nearest mesh in scene ending at or left of obj's left side, or (None, None)."""
+        self.ensure(scene)
+        key = obj.as_pointer()
+        low = float(get_cached_world_bounds([obj])[0][0, 0])
+        i = bisect_right(self.rights, (low, float("inf"))) - 1
+        while i >= 0:
+            high, other = self.rights[i]
+            if other != key:
+                found = self._resolve(other)
+                if found is None:
+                    return self.nearest_left(scene, obj)
+                return found, low - high
+            i -= 1
+        return None, None
+
+    def right_neighbours(self, scene):
+        """Return (keys, neighbour keys, gaps) for every mesh in scene with a mesh to its right, in one vectorized search."""
+        self.ensure(scene)
+        # Every entry is reported, so all are checked for deleted or renamed objects first
+        if not all(self._resolve(key) is not None for key in list(self.names)):
+            self.ensure(scene)
+        if not self.lefts:
+            return [], [], np.empty(0)
+        left_x = np.array([low for low, _key in self.lefts])
+        left_keys = [key for _low, key in self.lefts]
+        keys = list(self.bounds)
+        right_x = np.array([self.bounds[key][1] for key in keys])
+        idx = np.searchsorted(left_x, right_x, side='left')
+        found, neighbours, gaps = [], [], []
+        for key, high, i in zip(keys, right_x, idx):
+            # Only a zero-width object can find itself first
+            if i < len(left_keys) and left_keys[i] == key:
+                i += 1
+            if i < len(left_keys):
+                found.append(key)
+                neighbours.append(left_keys[i])
+                gaps.append(left_x[i] - high)
+        return found, neighbours, np.array(gaps)
+
+_spatial_index = SweepIndex()
+
+def _bump_mesh_version(mesh):
+    global _mesh_version_counter
+    _mesh_version_counter += 1
+    _mesh_versions[mesh.as_pointer()] = _mesh_version_counter
+
+def _mesh_coords(mesh):
+    """Copy mesh's local vertex coordinates out as an (n, 3) float64 array."""
+    count = len(mesh.vertices)
+    coords = np.empty(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    return coords.reshape(count, 3).astype(np.float64)
+
+def _compute_local_hull(mesh):
+    """Return the local-space convex hull vertices of mesh, falling back to all vertices for degenerate meshes."""
+    coords = _mesh_coords(mesh)
+    if len(coords) <= 8:
+        return coords
+
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(mesh)
+        hull = bmesh.ops.convex_hull(bm, input=bm.verts[:])
+        hull_coords = [v.co[:] for v in hull["geom"] if isinstance(v, bmesh.types.BMVert)]
+    finally:
+        bm.free()
+    # Flat or collinear meshes have no 3D hull
+    if len(hull_coords) < 4:
+        return coords
+    return np.array(hull_coords, dtype=np.float64)
+
+def get_mesh_hull(mesh):
+    """Return the cached local-space convex hull of mesh, rebuilding it only when the mesh data version changes."""
+    key = mesh.as_pointer()
+    version = (_mesh_versions.get(key, 0), len(mesh.vertices))
+    cached = _hull_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    hull = _compute_local_hull(mesh)
+    _hull_cache[key] = (version, hull)
+    return hull
+
+def _is_deformed(obj):
+    """Return True when obj's evaluated mesh can differ from its mesh data, through modifiers or shape keys."""
+    return bool(obj.modifiers) or obj.data.shape_keys is not None
+
+def get_object_hull(obj):
+    """Return the local-space convex hull of obj's evaluated geometry.
+
+    Undeformed objects share their mesh's cached hull. Objects with modifiers or shape keys hull their evaluated
+    mesh, cached per object until the depsgraph reports a geometry update or the frame changes.
+    """
+    if not _is_deformed(obj):
+        return get_mesh_hull(obj.data)
+    key = obj.as_pointer()
+    version = _mesh_versions.get(obj.data.as_pointer(), 0)
+    cached = _evaluated_hull_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    eval_obj = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+    mesh = eval_obj.to_mesh()
+    try:
+        hull = _compute_local_hull(mesh)
+    finally:
+        eval_obj.to_mesh_clear()
+    if not len(hull):
+        raise ValueError(f"{obj.name} has no evaluated geometry")
+    _evaluated_hull_cache[key] = (version, hull)
+    return hull
+
+def get_exact_x_extent(obj):
+    """Return the (min, max) world X of obj's real geometry, honouring rotation and scale."""
+    hull = get_object_hull(obj)
+    row = np.array(obj.matrix_world)[0]
+    # Only the X row of the world matrix is needed to project the hull onto the axis
+    xs = hull @ row[:3] + row[3]
+    return float(xs.min()), float(xs.max())
+
+def get_exact_bounds(obj):
+    """Return the world-space (mins, maxs) of obj's real geometry, honouring rotation and scale."""
+    return transform_points_bounds(get_object_hull(obj), np.array(obj.matrix_world))
+
+def _mesh_fingerprint(mesh):
+    """Return the vertex count followed by a BLAKE2b hash of mesh's vertex coordinates."""
+    count = len(mesh.vertices)
+    coords = np.empty(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    digest = hashlib.blake2b(coords.tobytes(), digest_size=16).digest()
+    # 16-bit words survive the float round trip through ID properties exactly
+    return np.concatenate(([count], np.frombuffer(digest, dtype='<u2')))
+
+def get_object_fingerprint(obj, depsgraph=None):
+    """Return the (FINGERPRINT_SIZE,) fingerprint of obj's world transform and mesh data.
+
+    With a depsgraph, or for objects with modifiers or shape keys, the evaluated mesh is fingerprinted, so
+    their results are covered; otherwise the original mesh is, memoised per mesh data version.
+    """
+    if depsgraph is not None or _is_deformed(obj):
+        mesh_part = _mesh_fingerprint(obj.evaluated_get(depsgraph or bpy.context.evaluated_depsgraph_get()).data)
+    else:
+        key = obj.data.as_pointer()
+        version = (_mesh_versions.get(key, 0), len(obj.data.vertices))
+        cached = _mesh_fingerprints.get(key)
+        if cached is None or cached[0] != version:
+            cached = (version, _mesh_fingerprint(obj.data))
+            _mesh_fingerprints[key] = cached
+        mesh_part = cached[1]
+    return np.concatenate((np.array(obj.matrix_world).ravel(), mesh_part))
+
+def _measurement_key(obj1, obj2, mode):
+    # ID property names are limited to 63 bytes, so the pair is hashed and the names kept inside the entry
+    return hashlib.md5(f"{mode}\0{obj1.name}\0{obj2.name}".encode()).hexdigest()
+
+def load_measurement(scene, obj1, obj2, mode, fingerprint):
+    """Return the stored result values for obj1, obj2 and mode if their fingerprint still matches, else None."""
+    store = scene.get(MEASUREMENT_STORE)
+    entry = store.get(_measurement_key(obj1, obj2, mode)) if store is not None else None
+    if entry is None:
+        return None
+    values = np.array(entry["values"], dtype=np.float64)
+    if len(values) < len(fingerprint) or not np.allclose(values[:len(fingerprint)], fingerprint, rtol=1e-6, atol=1e-7):
+        return None
+    return values[len(fingerprint):]
+
+def save_measurement(scene, obj1, obj2, mode, fingerprint, results):
+    """Persist results for obj1, obj2 and mode in scene as one float array prefixed with their fingerprint."""
+    store = scene.get(MEASUREMENT_STORE)
+    if store is None:
+        scene[MEASUREMENT_STORE] = {}
+        store = scene[MEASUREMENT_STORE]
+    key = _measurement_key(obj1, obj2, mode)
+    if key not in store and len(store) >= MEASUREMENT_STORE_LIMIT:
+        # Entries keep insertion order, so the oldest one goes first
+        del store[next(iter(store.keys()))]
+    store[key] = {
+        "obj1": obj1.name,
+        "obj2": obj2.name,
+        "mode": mode,
+        "values": np.concatenate((fingerprint, np.asarray(results, dtype=np.float64))).tolist(),
+    }
+
+def clear_stored_measurements(scene):
+    """Remove every persisted measurement from scene and return how many there were."""
+    store = scene.get(MEASUREMENT_STORE)
+    if store is None:
+        return 0
+    count = len(store)
+    del scene[MEASUREMENT_STORE]
+    return count
+
+def get_exact_gaps(obj1, obj2, persist=False):
+    """Calculate the signed X, Y and Z distances from obj1 to obj2 and their Euclidean separation using their actual vertices.
+
+    With persist, the result is stored in the current scene and reused, without building any hull, while both
+    objects' fingerprints match; bulk callers leave it off so they do not churn the store.
+    """
+    validate_mesh_pair(obj1, obj2)
+    if persist:
+        scene = bpy.context.scene
+        fingerprint = np.concatenate((get_object_fingerprint(obj1), get_object_fingerprint(obj2)))
+        stored = load_measurement(scene, obj1, obj2, 'EXACT', fingerprint)
+        if stored is not None:
+            return stored[:3], float(stored[3])
+    mins1, maxs1 = get_exact_bounds(obj1)
+    mins2, maxs2 = get_exact_bounds(obj2)
+    gaps, separation = gaps_from_bounds(mins1, maxs1, mins2, maxs2)
+    if persist:
+        save_measurement(scene, obj1, obj2, 'EXACT', fingerprint, [*gaps, separation])
+    return gaps, float(separation)
+
+def get_exact_x_distance(obj1, obj2):
+    """Calculate the X-axis distance from the right side of obj1 to the left side of obj2 using their actual vertices."""
+    return float(get_exact_gaps(obj1, obj2)[0][0])
+
+def get_instance_groups(depsgraph, mode='BOUNDS'):
+    """Return {owner pointer: [(source, (k, 4, 4) world matrices)]} for every object drawing meshes in depsgraph.
+
+    source is the local points shared by the k placements, or in EXACT mode the original mesh whose cached
+    hull gives them. The scene is walked once per depsgraph evaluation and mode; the depsgraph and frame
+    change handlers drop the result.
+    """
+    key = depsgraph.as_pointer()
+    if _instance_cache["depsgraph"] != key:
+        _instance_cache["depsgraph"] = key
+        _instance_cache["modes"] = {}
+        _instance_cache["bounds"] = {}
+    groups = _instance_cache["modes"].get(mode)
+    if groups is not None:
+        return groups
+
+    sources = {}
+    # Owner pointer -> evaluated mesh pointer -> world matrices
+    placements = {}
+    for instance in depsgraph.object_instances:
+        owner = instance.parent if instance.is_instance else instance.object
+        if owner is None or instance.object.type != 'MESH':
+            continue
+        mesh = instance.object.data
+        if len(mesh.vertices) == 0:
+            continue
+        mesh_key = mesh.as_pointer()
+        if mesh_key not in sources:
+            if mode != 'EXACT':
+                sources[mesh_key] = np.array(instance.object.bound_box, dtype=np.float64)
+            elif mesh.original.is_evaluated or _is_deformed(instance.object.original):
+                # Generated meshes (geometry nodes) have no original and modified ones differ from it, while their
+                # pointers are reused by later evaluations, so their vertices are copied out rather than hull-cached
+                sources[mesh_key] = _mesh_coords(mesh)
+            else:
+                sources[mesh_key] = mesh.original
+        # Instances are only valid during iteration, so the matrix is copied out now and converted in bulk later
+        placements.setdefault(owner.original.as_pointer(), {}).setdefault(mesh_key, []).append(instance.matrix_world.copy())
+    groups = {
+        owner: [(sources[mesh_key], np.array(matrices)) for mesh_key, matrices in meshes.items()]
+        for owner, meshes in placements.items()
+    }
+    _instance_cache["modes"][mode] = groups
+    return groups
+
+def get_instance_world_bounds(objects, depsgraph, mode='BOUNDS'):
+    """Return world-space AABB (mins, maxs) of everything each of objects draws, including its instances.
+
+    Local bounds (hulls in EXACT mode) are read once per unique mesh and then transformed for all of that
+    mesh's instances in one array operation, so the cost follows the number of unique meshes rather than
+    the number of instances. Each object's bounds are reused until the next depsgraph update.
+    """
+    groups = get_instance_groups(depsgraph, mode)
+    cached = _instance_cache["bounds"]
+    mins = np.full((len(objects), 3), np.inf)
+    maxs = np.full((len(objects), 3), -np.inf)
+    for i, obj in enumerate(objects):
+        key = (mode, obj.as_pointer())
+        if key not in cached:
+            for source, matrices in groups.get(key[1], ()):
+                points = source if isinstance(source, np.ndarray) else get_mesh_hull(source)
+                instance_mins, instance_maxs = shared_points_bounds(points, matrices)
+                mins[i] = np.minimum(mins[i], instance_mins.min(axis=0))
+                maxs[i] = np.maximum(maxs[i], instance_maxs.max(axis=0))
+            cached[key] = (mins[i].copy(), maxs[i].copy())
+        mins[i], maxs[i] = cached[key]
+    empty = [objects[i].name for i in np.flatnonzero(np.isinf(mins[:, 0]))]
+    if empty:
+        raise ValueError(f"No mesh geometry found for {', '.join(empty)}")
+    return mins, maxs
+
+def get_instance_gaps(obj1, obj2, mode='BOUNDS', depsgraph=None):
+    """Calculate the signed X, Y and Z distances from obj1 to obj2 and their Euclidean separation over all geometry they instance."""
+    validate_measurable_pair(obj1, obj2)
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+    mins, maxs = get_instance_world_bounds([obj1, obj2], depsgraph, mode)
+    gaps, separation = gaps_from_bounds(mins[0], maxs[0], mins[1], maxs[1])
+    return gaps, float(separation)
+
+def measure_x_distance(obj1, obj2, mode='BOUNDS'):
+    """Measure the X-distance from obj1 to obj2 with the given measure mode."""
+    if is_instancer(obj1) or is_instancer(obj2):
+        return float(get_instance_gaps(obj1, obj2, mode)[0][0])
+    if mode == 'EXACT':
+        return get_exact_x_distance(obj1, obj2)
+    return get_bounding_box_x_distance(obj1, obj2)
+
+def measure_gaps(obj1, obj2, mode='BOUNDS', persist=False):
+    """Measure the signed X, Y and Z distances from obj1 to obj2 and their Euclidean separation with the given measure mode.
+
+    persist stores and reuses EXACT results in the scene, see get_exact_gaps.
+    """
+    if is_instancer(obj1) or is_instancer(obj2):
+        return get_instance_gaps(obj1, obj2, mode)
+    if mode == 'EXACT':
+        return get_exact_gaps(obj1, obj2, persist)
+    return get_bounding_box_gaps(obj1, obj2)
+
+def measure_axis_distance(obj1, obj2, mode='BOUNDS', axis=0):
+    """Measure the signed distance from obj1 to obj2 along one axis (0, 1 or 2) with the given measure mode."""
+    if axis == 0:
+        return measure_x_distance(obj1, obj2, mode)
+    return float(measure_gaps(obj1, obj2, mode)[0][axis])
+
+def _evaluated_world_mesh(obj, depsgraph):
+    """Return world-space vertices (n, 3) and loop triangles (t, 3) of obj's evaluated mesh."""
+    eval_obj = obj.evaluated_get(depsgraph)
+    mesh = eval_obj.to_mesh()
+    try:
+        mesh.calc_loop_triangles()
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("vertices", triangles)
+        matrix = np.array(eval_obj.matrix_world)
+    finally:
+        eval_obj.to_mesh_clear()
+    world = coords.reshape(-1, 3).astype(np.float64) @ matrix[:3, :3].T + matrix[:3, 3]
+    return world, triangles.reshape(-1, 3)
+
+def _evaluated_local_coords(obj, depsgraph):
+    """Copy obj's evaluated vertex coordinates (n, 3) out once, with its row-major world matrix."""
+    eval_obj = obj.evaluated_get(depsgraph)
+    mesh = eval_obj.to_mesh()
+    try:
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        matrix = np.array(eval_obj.matrix_world)
+    finally:
+        eval_obj.to_mesh_clear()
+    return coords.reshape(-1, 3), matrix
+
+def _run_background_job(job, coords1, row1, coords2, row2):
+    """Worker thread body: reduce both vertex buffers to the gap along the job's axis."""
+    total = max(len(coords1) + len(coords2), 1)
+    done = [0]
+
+    def progress(count):
+        done[0] += count
+        job["progress"] = done[0] / total
+
+    try:
+        extent1 = projected_extent(coords1, row1, job["cancel"], progress)
+        extent2 = projected_extent(coords2, row2, job["cancel"], progress)
+        if extent1 is None or extent2 is None:
+            job["state"] = 'CANCELLED'
+            return
+        job["result"] = float(extent2[0] - extent1[1])
+        job["state"] = 'DONE'
+    except Exception as e:
+        job["error"] = str(e)
+        job["state"] = 'ERROR'
+
+def _tag_redraw_view3d():
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+def _poll_background_job():
+    """Timer callback: mirror the current job's progress into the panel and deliver its result when it finishes."""
+    job = _background["job"]
+    scene = bpy.data.scenes.get(job["scene"]) if job else None
+    if scene is None:
+        return None
+    props = scene.dist_tool
+    props.background_progress = job["progress"]
+    _tag_redraw_view3d()
+    if job["state"] == 'RUNNING':
+        return 0.1
+
+    props.background_running = False
+    if job["state"] == 'DONE':
+        axis = "XYZ"[job["axis"]]
+        if job["axis"] == 0:
+            props.distance = job["result"]
+        props.result = f"{axis} Distance (exact, background): {job['result']:.4f} units"
+    elif job["state"] == 'ERROR':
+        props.result = f"Error: {job['error']}"
+    else:
+        props.result = "Background measurement cancelled"
+    return None
+
+def cancel_background_measurement():
+    """Ask the running background measurement, if any, to stop at its next chunk."""
+    job = _background["job"]
+    if job is not None:
+        job["cancel"].set()
+
+def start_background_measurement(scene, obj1, obj2, depsgraph, axis=0):
+    """Copy both evaluated meshes into NumPy buffers and measure their exact gap along axis in a worker thread.
+
+    A newer request supersedes the running one, and the result is delivered to scene's Distance Tool
+    properties from a bpy.app.timers callback.
+    """
+    validate_mesh_pair(obj1, obj2)
+    cancel_background_measurement()
+    coords1, matrix1 = _evaluated_local_coords(obj1, depsgraph)
+    coords2, matrix2 = _evaluated_local_coords(obj2, depsgraph)
+    job = {
+        "scene": scene.name,
+        "axis": axis,
+        "cancel": threading.Event(),
+        "progress": 0.0,
+        "state": 'RUNNING',
+        "result": None,
+        "error": None,
+    }
+    _background["job"] = job
+    thread = threading.Thread(target=_run_background_job, args=(job, coords1, matrix1[axis], coords2, matrix2[axis]), daemon=True)
+    thread.start()
+    scene.dist_tool.background_running = True
+    scene.dist_tool.background_progress = 0.0
+    if not bpy.app.timers.is_registered(_poll_background_job):
+        bpy.app.timers.register(_poll_background_job, first_interval=0.1)
+    return job
+
+def get_world_bvh(obj, depsgraph):
+    """Return (tree, world vertices, triangles, edges, (min, max)) for obj, reusing the cached tree while its mesh and transform are unchanged."""
+    key = obj.as_pointer()
+    stamp = (_mesh_versions.get(obj.data.as_pointer(), 0), tuple(v for row in obj.matrix_world for v in row))
+    cached = _bvh_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1:]
+    verts, triangles = _evaluated_world_mesh(obj, depsgraph)
+    if not len(triangles):
+        raise ValueError(f"{obj.name} has no faces to measure a surface distance from")
+    tree = BVHTree.FromPolygons(verts.tolist(), triangles.tolist())
+    entry = (stamp, tree, verts, triangles, triangle_edges(triangles), (verts.min(axis=0), verts.max(axis=0)))
+    _bvh_cache[key] = entry
+    return entry[1:]
+
+def _nearest_to_tree(points, tree, bounds, limit=float("inf")):
+    """Return (distance, point, nearest) for whichever of points lies closest to the surface in tree."""
+    box_min, box_max = bounds
+    # Distance to the tree's AABB is a lower bound on the distance to its surface,
+    # so points are visited nearest-box-first and the scan stops once no point can win
+    lower = box_distances(points, box_min, box_max)
+    best = (limit, None, None)
+    for i in np.argsort(lower, kind='stable'):
+        if lower[i] >= best[0]:
+            break
+        co = Vector(points[i])
+        location, _normal, _index, distance = tree.find_nearest(co) if best[0] == float("inf") else tree.find_nearest(co, best[0])
+        if location is not None and distance < best[0]:
+            best = (distance, co, location)
+    return best
+
+def get_surface_distance(obj1, obj2, depsgraph, persist=False):
+    """Return (distance, point on obj1, point on obj2) for the closest points between the evaluated surfaces of obj1 and obj2.
+
+    With persist, the result is stored in the current scene and reused while both objects' fingerprints match.
+    """
+    validate_mesh_pair(obj1, obj2)
+    if persist:
+        scene = bpy.context.scene
+        fingerprint = np.concatenate((get_object_fingerprint(obj1, depsgraph), get_object_fingerprint(obj2, depsgraph)))
+        stored = load_measurement(scene, obj1, obj2, 'SURFACE', fingerprint)
+        if stored is not None:
+            return float(stored[0]), Vector(stored[1:4]), Vector(stored[4:7])
+
+    tree1, verts1, triangles1, edges1, bounds1 = get_world_bvh(obj1, depsgraph)
+    tree2, verts2, _triangles2, edges2, bounds2 = get_world_bvh(obj2, depsgraph)
+
+    overlap = tree1.overlap(tree2)
+    if overlap:
+        # Intersecting surfaces touch; report the centre of the first intersecting triangle
+        location = Vector(verts1[triangles1[overlap[0][0]]].mean(axis=0))
+        distance, point1, point2 = 0.0, location, location
+    else:
+        # Disjoint triangles are closest either at a vertex of one against the other's surface or between two edges
+        distance, point2, point1 = _nearest_to_tree(verts2, tree1, bounds1)
+        best1 = _nearest_to_tree(verts1, tree2, bounds2, distance)
+        if best1[1] is not None:
+            distance, point1, point2 = best1
+        # Sweep edges along the axis the closest vertex pair is furthest apart on, where their boxes separate soonest
+        axis = int(np.argmax(np.abs(np.array(point2) - np.array(point1))))
+        best_edges = closest_segment_pair(
+            verts1[edges1[:, 0]], verts1[edges1[:, 1]], verts2[edges2[:, 0]], verts2[edges2[:, 1]], distance, axis)
+        if best_edges is not None:
+            distance, point1, point2 = best_edges[0], Vector(best_edges[1]), Vector(best_edges[2])
+    if persist:
+        save_measurement(scene, obj1, obj2, 'SURFACE', fingerprint, [distance, *point1, *point2])
+    return distance, point1, point2
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    """Invalidate cached bounds of moved or reshaped objects and track mesh geometry changes for the hull cache."""
+    _instance_cache["depsgraph"] = None
+    for update in depsgraph.updates:
+        id_data = update.id.original
+        if isinstance(id_data, bpy.types.Mesh):
+            _bump_mesh_version(id_data)
+        elif isinstance(id_data, bpy.types.Object):
+            if update.is_updated_transform or update.is_updated_geometry:
+                key = id_data.as_pointer()
+                _bounds_cache.pop(key, None)
+                _spatial_index.mark_stale(key, id_data.name)
+                if key in _rules_state["own_writes"]:
+                    _rules_state["own_writes"].discard(key)
+                else:
+                    _rules_state["dirty"].add(key)
+            if update.is_updated_geometry and id_data.type == 'MESH':
+                _bump_mesh_version(id_data.data)
+
+@persistent
+def _on_frame_change_post(*args):
+    """Animation playback does not report per-object updates, so cached bounds, evaluated hulls and BVH trees are dropped on every frame change.
+
+    Trees are stamped with the mesh data version and world matrix only, which do not change when an armature,
+    shape keys or animated modifiers deform the evaluated mesh.
+    """
+    _bounds_cache.clear()
+    _bvh_cache.clear()
+    _evaluated_hull_cache.clear()
+    _instance_cache["depsgraph"] = None
+    _spatial_index.invalidate()
+
+@persistent
+def _on_load_post(*args):
+    """Drop pointer-keyed caches, which are meaningless in a newly loaded file, and restore the live handler if the file uses it."""
+    _mesh_versions.clear()
+    clear_distance_caches()
+    _live_state["own_write"] = False
+    cancel_background_measurement()
+    _rules_state["dirty"].clear()
+    _rules_state["own_writes"].clear()
+    _sync_live_handler(any(scene.dist_tool.live_adjust for scene in bpy.data.scenes))
+    if bpy.context.scene:
+        set_log_level(bpy.context.scene.dist_tool.log_level)
+
+def _rule_inputs(rule):
+    return [obj for obj in (rule.obj1, rule.obj2, rule.reference) if obj]
+
+def _ancestor_keys(obj):
+    """Return the pointers of obj and all of its parents, since moving any of them moves obj."""
+    keys = []
+    while obj:
+        keys.append(obj.as_pointer())
+        obj = obj.parent
+    return keys
+
+def build_rule_graph(rules):
+    """Return (order, downstream, readers) for the enabled rules.
+
+    order lists rule indices topologically, downstream maps a rule index to the rules reading its target,
+    and readers maps an object pointer to the rules that read it. Raises ValueError if the rules form a cycle
+    or a rule reads its own target.
+    """
+    enabled = [i for i, rule in enumerate(rules) if rule.enabled and rule.obj1 and rule.obj2 and rule.reference and rule.target]
+    producers = {rules[i].target.as_pointer(): i for i in enabled}
+    readers = {}
+    downstream = {i: [] for i in enabled}
+    indegree = {i: 0 for i in enabled}
+    self_dependent = []
+    for i in enabled:
+        upstream = set()
+        for obj in _rule_inputs(rules[i]):
+            for key in _ancestor_keys(obj):
+                readers.setdefault(key, []).append(i)
+                producer = producers.get(key)
+                if producer is not None:
+                    upstream.add(producer)
+        if i in upstream:
+            # Moving the target would change the rule's own measurement, so every re-solve moves it further
+            self_dependent.append(rules[i].name)
+            upstream.discard(i)
+        for producer in upstream:
+            downstream[producer].append(i)
+            indegree[i] += 1
+
+    if self_dependent:
+        raise ValueError(f"Distance rules read their own target: {', '.join(self_dependent)}")
+
+    # Kahn's algorithm with a first-in first-out queue, keeping list order among independent rules
+    ready = deque(i for i in enabled if indegree[i] == 0)
+    order = []
+    while ready:
+        i = ready.popleft()
+        order.append(i)
+        for j in downstream[i]:
+            indegree[j] -= 1
+            if indegree[j] == 0:
+                ready.append(j)
+    if len(order) != len(enabled):
+        cyclic = [rules[i].name for i in enabled if indegree[i] > 0]
+        raise ValueError(f"Distance rules form a cycle: {', '.join(cyclic)}")
+    return order, downstream, readers
+
+def solve_distance_rules(rules, mode='BOUNDS', dirty=None):
+    """Solve rules in dependency order and return the number of rules evaluated.
+
+    With dirty (a set of object pointers) only the rules reading those objects and everything downstream of them
+    are evaluated. Targets moved earlier in the pass shift the measured bounds of their dependents directly,
+    so the chain is solved without a depsgraph evaluation per rule.
+    """
+    order, downstream, readers = build_rule_graph(rules)
+    if dirty is None:
+        active = set(order)
+    else:
+        active = set()
+        stack = [i for key in dirty for i in readers.get(key, ())]
+        while stack:
+            i = stack.pop()
+            if i not in active:
+                active.add(i)
+                stack.extend(downstream[i])
+    if not active:
+        return 0
+
+    measured = {}
+    for i in active:
+        for obj in (rules[i].obj1, rules[i].obj2):
+            measured[obj.as_pointer()] = obj
+    objects = list(measured.values())
+    if mode == 'EXACT':
+        extents = {obj.as_pointer(): get_exact_x_extent(obj) for obj in objects}
+    else:
+        mins, maxs = get_cached_world_bounds(objects)
+        extents = {obj.as_pointer(): (mins[k, 0], maxs[k, 0]) for k, obj in enumerate(objects)}
+
+    # X moves applied during this pass, per moved target pointer
+    shifts = {}
+    def shift(obj):
+        return sum(shifts.get(key, 0.0) for key in _ancestor_keys(obj)) if shifts else 0.0
+
+    for i in order:
+        if i not in active:
+            continue
+        rule = rules[i]
+        gap = (extents[rule.obj2.as_pointer()][0] + shift(rule.obj2)) - (extents[rule.obj1.as_pointer()][1] + shift(rule.obj1))
+        rule.distance = gap
+        target_x = solve_target_x(rule.original_location[0], rule.reference.location.x, gap, rule.distance_offset)
+        delta = target_x - rule.target.location.x
+        if abs(delta) > 1e-6:
+            key = rule.target.as_pointer()
+            shifts[key] = shifts.get(key, 0.0) + delta
+            _rules_state["own_writes"].add(key)
+            rule.target.location.x = target_x
+    return len(active)
+
+def _complete_rules(rules):
+    return [rule for rule in rules if rule.enabled and rule.obj1 and rule.obj2 and rule.reference and rule.target]
+
+def get_rule_axis_distances(rules, mode='BOUNDS', axis=0):
+    """Return the signed distance from obj1 to obj2 along axis for every rule, measuring all bounding boxes in one batch."""
+    if mode != 'BOUNDS' or any(is_instancer(obj) for rule in rules for obj in (rule.obj1, rule.obj2)):
+        return np.array([measure_axis_distance(rule.obj1, rule.obj2, mode, axis) for rule in rules], dtype=np.float64)
+    measured = {}
+    for rule in rules:
+        validate_mesh_pair(rule.obj1, rule.obj2)
+        for obj in (rule.obj1, rule.obj2):
+            measured.setdefault(obj.as_pointer(), (len(measured), obj))
+    mins, maxs = get_cached_world_bounds([obj for _i, obj in measured.values()])
+    first = np.array([measured[rule.obj1.as_pointer()][0] for rule in rules], dtype=np.int64)
+    second = np.array([measured[rule.obj2.as_pointer()][0] for rule in rules], dtype=np.int64)
+    return mins[second, axis] - maxs[first, axis]
+
+def _read_all_locations():
+    """Return (index by object pointer, (n, 3) locations) for every object in bpy.data in one bulk read."""
+    objects = bpy.data.objects
+    locations = np.empty(len(objects) * 3, dtype=np.float32)
+    objects.foreach_get("location", locations)
+    index = {obj.as_pointer(): i for i, obj in enumerate(objects)}
+    return index, locations.reshape(-1, 3)
+
+def _write_all_locations(locations, moved):
+    """Write every object's location back in one bulk set and tag the moved objects for re-evaluation."""
+    bpy.data.objects.foreach_set("location", locations.ravel())
+    for obj in moved:
+        obj.update_tag(refresh={'OBJECT'})
+
+def bulk_move_rule_targets(rules, mode='BOUNDS', axis=0):
+    """Move every complete rule's target away from its reference by the measured distance plus offset along axis, like Move Empty Cube Target.
+
+    Directions and moves are computed for all rules at once and written back in one bulk set. A target
+    without a stored original location remembers its current one first. Returns the number of rules applied.
+    """
+    rules = _complete_rules(rules)
+    if not rules:
+        return 0
+    distances = get_rule_axis_distances(rules, mode, axis)
+    index, locations = _read_all_locations()
+    targets = np.array([index[rule.target.as_pointer()] for rule in rules], dtype=np.int64)
+    references = np.array([index[rule.reference.as_pointer()] for rule in rules], dtype=np.int64)
+    offsets = np.array([rule.distance_offset for rule in rules], dtype=np.float64)
+
+    for rule, location, distance in zip(rules, locations[targets], distances.tolist()):
+        if tuple(rule.original_location) == (0, 0, 0):
+            rule.original_location = location
+        rule.distance = distance
+
+    directions = np.where(locations[targets, axis] > locations[references, axis], 1.0, -1.0)
+    # Several rules may drive the same target; their moves add up as repeated single moves would
+    np.add.at(locations[:, axis], targets, directions * (distances + offsets))
+    _write_all_locations(locations, {rule.target.as_pointer(): rule.target for rule in rules}.values())
+    return len(rules)
+
+def bulk_reset_rule_targets(rules):
+    """Return every rule target with a stored original location to it in one bulk set and return how many were reset."""
+    rules = [rule for rule in rules if rule.target and tuple(rule.original_location) != (0, 0, 0)]
+    if not rules:
+        return 0
+    index, locations = _read_all_locations()
+    targets = np.array([index[rule.target.as_pointer()] for rule in rules], dtype=np.int64)
+    locations[targets] = np.array([rule.original_location for rule in rules], dtype=np.float32)
+    _write_all_locations(locations, {rule.target.as_pointer(): rule.target for rule in rules}.values())
+    return len(rules)
+
+def _live_solve():
+    """Timer callback: re-measure and re-position Empty Cube Target once for a burst of depsgraph updates."""
+    _live_state["last_solve"] = time.perf_counter()
+    props = bpy.context.scene.dist_tool
+    if props.live_adjust and props.rules and _rules_state["dirty"]:
+        dirty = _rules_state["dirty"]
+        _rules_state["dirty"] = set()
+        try:
+            solve_distance_rules(props.rules, props.measure_mode, dirty)
+        except ValueError as e:
+            props.result = f"Error: {str(e)}"
+    obj1, obj2, ref, target = props.obj1, props.obj2, props.reference, props.empty_cube_target
+    if not props.live_adjust or not obj1 or not obj2 or not ref or not target or obj1 == obj2:
+        return None
+
+    try:
+        distance = measure_x_distance(obj1, obj2, props.measure_mode)
+    except ValueError as e:
+        props.result = f"Error: {str(e)}"
+        return None
+    props.distance = distance
+    target_x = solve_target_x(props.original_location[0], ref.location.x, distance, props.distance_offset)
+    # Skip no-op writes so a settled layout produces no further depsgraph updates
+    if abs(target.location.x - target_x) > 1e-6:
+        _live_state["own_write"] = True
+        target.location.x = target_x
+    return None
+
+@persistent
+def _on_live_depsgraph_update(scene, depsgraph):
+    """Queue a live solve when Object 1, Object 2 or the Reference Empty changed."""
+    props = scene.dist_tool
+    if not props.live_adjust:
+        return
+    watched = {obj.as_pointer() for obj in (props.obj1, props.obj2, props.reference) if obj}
+    target = props.empty_cube_target.as_pointer() if props.empty_cube_target else None
+    changed = set()
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object) and (update.is_updated_transform or update.is_updated_geometry):
+            changed.add(update.id.original.as_pointer())
+
+    if _live_state["own_write"] and target in changed:
+        # This batch is the echo of our own target move; ignore it even if the target drives a watched object
+        _live_state["own_write"] = False
+        return
+    if not (changed & watched or (props.rules and _rules_state["dirty"])) or bpy.app.timers.is_registered(_live_solve):
+        return
+    delay = max(0.0, _live_state["last_solve"] + LIVE_SOLVE_INTERVAL - time.perf_counter())
+    bpy.app.timers.register(_live_solve, first_interval=delay)
+
+def _remove_stale_handlers(handlers, name):
+    """Remove handlers called name, including ones left by an earlier run of this script from the Text Editor."""
+    for handler in [handler for handler in handlers if getattr(handler, "__name__", None) == name]:
+        handlers.remove(handler)
+
+def _sync_live_handler(enabled):
+    handlers = bpy.app.handlers.depsgraph_update_post
+    if enabled and _on_live_depsgraph_update not in handlers:
+        handlers.append(_on_live_depsgraph_update)
+    elif not enabled:
+        if _on_live_depsgraph_update in handlers:
+            handlers.remove(_on_live_depsgraph_update)
+        if bpy.app.timers.is_registered(_live_solve):
+            bpy.app.timers.unregister(_live_solve)
+
+def update_log_level(self, context):
+    """Apply the chosen log level to the shared logger."""
+    set_log_level(self.log_level)
+
+def update_live_adjust(self, context):
+    """Register or remove the live auto-adjust handler when the toggle changes."""
+    if self.live_adjust and self.empty_cube_target and tuple(self.original_location) == (0, 0, 0):
+        self.original_location = self.empty_cube_target.location.copy()
+    _live_state["own_write"] = False
+    _sync_live_handler(self.live_adjust)
+    if self.live_adjust and not bpy.app.timers.is_registered(_live_solve):
+        bpy.app.timers.register(_live_solve, first_interval=0.0)
+
+def update_rule_target_location(self, context):
+    """Update a rule's original_location when its target is set."""
+    if self.target:
+        self.original_location = self.target.location.copy()
+    else:
+        self.original_location = (0, 0, 0)
 
 def update_empty_cube_target_location(self, context):
     """Update original_location when Empty Cube Target is set."""
@@ -47,6 +1184,7 @@ def update_empty_cube_target_location(self, context):
     else:
         self.original_location = (0, 0, 0)
 
+@timed_operator
 class DistanceOperator(Operator):
     """Calculate the X-axis distance between Object 1's right side and Object 2's left side."""
     bl_idname = "object.measure_distance"
@@ -67,22 +1205,27 @@ class DistanceOperator(Operator):
             return {'CANCELLED'}
 
         try:
-            distance = get_bounding_box_x_distance(props.obj1, props.obj2)
+            gaps, separation = measure_gaps(props.obj1, props.obj2, props.measure_mode, persist=True)
+            distance = float(gaps[0])
             props.distance = distance
+            props.distance_y = float(gaps[1])
+            props.distance_z = float(gaps[2])
+            props.distance_euclid = separation
             props.result = f"X Distance: {distance:.4f} units"
             self.report({'INFO'}, props.result)
-            print(f"DEBUG: Calculated X-distance: {distance:.4f} units")
+            logger.debug("Calculated X-distance: %.4f units", distance)
             return {'FINISHED'}
         except ValueError as e:
             self.report({'ERROR'}, str(e))
             props.result = f"Error: {str(e)}"
             return {'CANCELLED'}
 
+@timed_operator
 class MoveObjectOperator(Operator):
-    """Move Empty Cube Target based on X-distance and reference empty."""
+    """Move Empty Cube Target based on the distance along Move Axis and reference empty."""
     bl_idname = "object.move_object"
     bl_label = "Move Empty Cube Target"
-    bl_description = "Move Empty Cube Target based on X-distance from Object 1 to Object 2 and reference empty"
+    bl_description = "Move Empty Cube Target based on the distance along Move Axis from Object 1 to Object 2 and reference empty"
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
@@ -100,22 +1243,619 @@ class MoveObjectOperator(Operator):
             return {'CANCELLED'}
 
         try:
-            distance = get_bounding_box_x_distance(obj1, obj2)
-            direction = 1 if empty_cube_target.location.x > ref.location.x else -1
+            axis = "XYZ".index(props.move_axis)
+            distance = measure_axis_distance(obj1, obj2, props.measure_mode, axis)
+            direction = 1 if empty_cube_target.location[axis] > ref.location[axis] else -1
             move_distance = distance + props.distance_offset
             # Store original location if not already set
             if props.original_location == (0, 0, 0) and empty_cube_target:
                 props.original_location = empty_cube_target.location.copy()
-            empty_cube_target.location.x += direction * move_distance
-            props.result = f"Moved Empty Cube Target by {move_distance:.4f} units {'right' if direction > 0 else 'left'}"
+            empty_cube_target.location[axis] += direction * move_distance
+            sense = f"{'+' if direction > 0 else '-'}{props.move_axis}" if axis else ('right' if direction > 0 else 'left')
+            props.result = f"Moved Empty Cube Target by {move_distance:.4f} units {sense}"
+            self.report({'INFO'}, props.result)
+            logger.debug("Moved %s by %.4f units %s", empty_cube_target.name, move_distance, sense)
+            return {'FINISHED'}
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            props.result = f"Error: {str(e)}"
+            return {'CANCELLED'}
+
+@timed_operator
+class SolveToGapOperator(Operator):
+    """Move Empty Cube Target iteratively until the measured X-distance reaches Target Gap."""
+    bl_idname = "object.solve_to_gap"
+    bl_label = "Solve to Gap"
+    bl_description = "Move Empty Cube Target with secant steps, re-evaluating the scene, until Object 1 and Object 2 are Target Gap apart"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        props = context.scene.dist_tool
+        obj1, obj2, ref, empty_cube_target = props.obj1, props.obj2, props.reference, props.empty_cube_target
+
+        if not obj1 or not obj2 or not ref or not empty_cube_target:
+            self.report({'ERROR'}, "Please select Object 1, Object 2, Reference Empty, and Empty Cube Target")
+            props.result = "Error: Select all objects"
+            return {'CANCELLED'}
+
+        if obj1 == obj2:
+            self.report({'ERROR'}, "Object 1 and Object 2 must be different")
+            props.result = "Error: Select different objects"
+            return {'CANCELLED'}
+
+        def evaluate(x):
+            if empty_cube_target.location.x != x:
+                empty_cube_target.location.x = x
+                # Constraints, drivers and modifiers only follow the target after a scene evaluation
+                context.view_layer.update()
+                _bounds_cache.pop(obj1.as_pointer(), None)
+                _bounds_cache.pop(obj2.as_pointer(), None)
+            return measure_x_distance(obj1, obj2, props.measure_mode)
+
+        try:
+            if tuple(props.original_location) == (0, 0, 0):
+                props.original_location = empty_cube_target.location.copy()
+            x0 = empty_cube_target.location.x
+            gap0 = measure_x_distance(obj1, obj2, props.measure_mode)
+            direction = 1 if x0 > ref.location.x else -1
+            # The first step is the plain Move: assume the target closes the gap one-to-one
+            x1 = x0 + direction * (gap0 - props.target_gap)
+            x, gap, evaluations = solve_gap_secant(evaluate, x0, x1, props.target_gap, props.solve_tolerance, props.solve_max_iterations, f0=gap0)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            props.result = f"Error: {str(e)}"
+            return {'CANCELLED'}
+
+        props.distance = gap
+        props.solve_evaluations = evaluations
+        if abs(gap - props.target_gap) <= props.solve_tolerance:
+            props.result = f"Reached gap {gap:.4f} in {evaluations} evaluations"
+            self.report({'INFO'}, props.result)
+        else:
+            props.result = f"Gap {gap:.4f} not converged after {evaluations} evaluations"
+            self.report({'WARNING'}, props.result)
+        return {'FINISHED'}
+
+@timed_operator
+class BakeAutoAdjustOperator(Operator):
+    """Bake Empty Cube Target's position across a frame range so it holds the gap on every frame."""
+    bl_idname = "object.bake_auto_adjust"
+    bl_label = "Bake Auto-Adjust"
+    bl_description = "Compute Empty Cube Target's position along Move Axis for every frame in the range and write it as keyframes"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        scene = context.scene
+        props = scene.dist_tool
+        obj1, obj2, ref, empty_cube_target = props.obj1, props.obj2, props.reference, props.empty_cube_target
+
+        if not obj1 or not obj2 or not ref or not empty_cube_target:
+            self.report({'ERROR'}, "Please select Object 1, Object 2, Reference Empty, and Empty Cube Target")
+            props.result = "Error: Select all objects"
+            return {'CANCELLED'}
+
+        if obj1 == obj2:
+            self.report({'ERROR'}, "Object 1 and Object 2 must be different")
+            props.result = "Error: Select different objects"
+            return {'CANCELLED'}
+
+        if props.bake_frame_end < props.bake_frame_start:
+            self.report({'ERROR'}, "End frame must not be before start frame")
+            props.result = "Error: Invalid frame range"
+            return {'CANCELLED'}
+
+        try:
+            validate_mesh_pair(obj1, obj2)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            props.result = f"Error: {str(e)}"
+            return {'CANCELLED'}
+
+        axis = "XYZ".index(props.move_axis)
+        frames = np.arange(props.bake_frame_start, props.bake_frame_end + 1)
+        if tuple(props.original_location) == (0, 0, 0):
+            props.original_location = empty_cube_target.location.copy()
+        anchor = props.original_location[axis]
+
+        if props.measure_mode == 'BOUNDS' and all(can_bake_from_fcurves(obj) for obj in (obj1, obj2, ref)):
+            # Only the three inputs' own F-Curves are evaluated; no scene evaluation per frame
+            high1 = get_animated_world_bounds(obj1, frames)[1][:, axis]
+            low2 = get_animated_world_bounds(obj2, frames)[0][:, axis]
+            ref_values = _evaluate_channel(ref, "location", frames)[:, axis]
+            gaps = low2 - high1
+            method = "F-Curves"
+        else:
+            current = scene.frame_current
+            gaps = np.empty(len(frames))
+            ref_values = np.empty(len(frames))
+            try:
+                for i, frame in enumerate(frames):
+                    scene.frame_set(int(frame))
+                    gaps[i] = measure_axis_distance(obj1, obj2, props.measure_mode, axis)
+                    ref_values[i] = ref.location[axis]
+            except ValueError as e:
+                self.report({'ERROR'}, str(e))
+                props.result = f"Error: {str(e)}"
+                return {'CANCELLED'}
+            finally:
+                scene.frame_set(current)
+            method = "scene evaluation"
+
+        direction = np.where(anchor > ref_values, 1.0, -1.0)
+        values = anchor + direction * (gaps + props.distance_offset)
+        write_fcurve_samples(empty_cube_target, "location", axis, frames, values)
+        props.result = f"Baked {len(frames)} frames via {method}"
+        self.report({'INFO'}, props.result)
+        return {'FINISHED'}
+
+@timed_operator
+class BackgroundMeasureOperator(Operator):
+    """Measure the exact distance between Object 1 and Object 2 in the background."""
+    bl_idname = "object.measure_distance_background"
+    bl_label = "Measure Exact in Background"
+    bl_description = "Measure the exact vertex distance along Move Axis in a worker thread, keeping the UI responsive"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        props = context.scene.dist_tool
+        if not props.obj1 or not props.obj2:
+            self.report({'ERROR'}, "Please select two mesh objects")
+            props.result = "Error: Select two mesh objects"
+            return {'CANCELLED'}
+
+        if props.obj1 == props.obj2:
+            self.report({'ERROR'}, "Please select two different mesh objects")
+            props.result = "Error: Select different objects"
+            return {'CANCELLED'}
+
+        try:
+            start_background_measurement(context.scene, props.obj1, props.obj2, context.evaluated_depsgraph_get(), "XYZ".index(props.move_axis))
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            props.result = f"Error: {str(e)}"
+            return {'CANCELLED'}
+        props.result = "Measuring in background..."
+        return {'FINISHED'}
+
+@timed_operator
+class CancelBackgroundMeasureOperator(Operator):
+    """Cancel the running background measurement."""
+    bl_idname = "object.cancel_background_measure"
+    bl_label = "Cancel"
+    bl_description = "Cancel the running background measurement"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        cancel_background_measurement()
+        return {'FINISHED'}
+
+@timed_operator
+class SurfaceDistanceOperator(Operator):
+    """Calculate the minimum surface-to-surface distance between Object 1 and Object 2."""
+    bl_idname = "object.measure_surface_distance"
+    bl_label = "Calculate Surface Distance"
+    bl_description = "Calculate the closest-point distance between the evaluated surfaces of Object 1 and Object 2"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        props = context.scene.dist_tool
+        if not props.obj1 or not props.obj2:
+            self.report({'ERROR'}, "Please select two mesh objects")
+            props.result = "Error: Select two mesh objects"
+            return {'CANCELLED'}
+
+        if props.obj1 == props.obj2:
+            self.report({'ERROR'}, "Please select two different mesh objects")
+            props.result = "Error: Select different objects"
+            return {'CANCELLED'}
+
+        try:
+            distance, point1, point2 = get_surface_distance(props.obj1, props.obj2, context.evaluated_depsgraph_get(), persist=True)
+            props.surface_distance = distance
+            props.surface_point1 = point1
+            props.surface_point2 = point2
+            props.result = f"Surface Distance: {distance:.4f} units"
             self.report({'INFO'}, props.result)
-            print(f"DEBUG: Moved {empty_cube_target.name} by {move_distance:.4f} units {'right' if direction > 0 else 'left'}")
             return {'FINISHED'}
         except ValueError as e:
             self.report({'ERROR'}, str(e))
             props.result = f"Error: {str(e)}"
             return {'CANCELLED'}
 
+@timed_operator
+class BatchDistanceOperator(Operator):
+    """Calculate the X-axis distances between neighbouring mesh objects of a collection."""
+    bl_idname = "object.measure_distance_batch"
+    bl_label = "Calculate Collection Distances"
+    bl_description = "Calculate X-axis distances between all neighbouring mesh objects of the chosen collection in one pass"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        props = context.scene.dist_tool
+        if not props.batch_collection:
+            self.report({'ERROR'}, "Please select a collection")
+            props.result = "Error: Select a collection"
+            return {'CANCELLED'}
+
+        objects = get_collection_mesh_objects(props.batch_collection)
+        if len(objects) < 2:
+            self.report({'ERROR'}, "Collection needs at least two mesh objects")
+            props.result = "Error: Not enough mesh objects"
+            return {'CANCELLED'}
+
+        order, gaps = get_neighbour_x_distances(objects)
+        props.batch_count = len(objects)
+        props.batch_min_gap = float(gaps.min())
+        props.batch_max_gap = float(gaps.max())
+        props.batch_overlaps = int((gaps < 0.0).sum())
+        props.result = (f"{len(gaps)} gaps: min {props.batch_min_gap:.4f}, max {props.batch_max_gap:.4f}, "
+                        f"{props.batch_overlaps} overlapping")
+        self.report({'INFO'}, props.result)
+        return {'FINISHED'}
+
+@timed_operator
+class ExportMeasurementsOperator(Operator, ExportHelper):
+    """Export pair measurements of the batch collection, or the whole scene, to CSV or JSON Lines."""
+    bl_idname = "object.export_distance_report"
+    bl_label = "Export Distance Report"
+    bl_description = "Stream per-axis gaps and overlap flags of neighbouring or too-close mesh pairs to a CSV or JSON Lines file"
+    bl_options = {'REGISTER'}
+
+    filename_ext = ".csv"
+    filter_glob: StringProperty(default="*.csv;*.jsonl", options={'HIDDEN'})
+    file_format: EnumProperty(
+        name="Format",
+        items=[
+            ('CSV', "CSV", "Comma-separated values with a header row"),
+            ('JSONL', "JSON Lines", "One JSON object per line"),
+        ],
+        default='CSV'
+    )
+    source: EnumProperty(
+        name="Pairs",
+        items=[
+            ('NEIGHBOURS', "Neighbours", "Each object and its right-hand neighbour along X"),
+            ('CLEARANCE', "Clearance", "Every pair that overlaps or sits closer than Clearance"),
+        ],
+        default='NEIGHBOURS'
+    )
+
+    def execute(self, context):
+        props = context.scene.dist_tool
+        if props.batch_collection:
+            objects = get_collection_mesh_objects(props.batch_collection)
+        else:
+            objects = [obj for obj in context.scene.objects if obj.type == 'MESH']
+        if len(objects) < 2:
+            self.report({'ERROR'}, "Need at least two mesh objects")
+            props.result = "Error: Not enough mesh objects"
+            return {'CANCELLED'}
+
+        path = self.filepath
+        if self.file_format == 'JSONL' and path.lower().endswith(".csv"):
+            path = path[:-4] + ".jsonl"
+        try:
+            count = export_measurements(objects, path, self.source, props.measure_mode, self.file_format, props.clearance)
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not write {path}: {e}")
+            props.result = f"Error: {e}"
+            return {'CANCELLED'}
+        props.result = f"Exported {count} pairs to {path}"
+        self.report({'INFO'}, props.result)
+        return {'FINISHED'}
+
+@timed_operator
+class DistributeXOperator(Operator):
+    """Space objects along X so neighbours are Distance Offset apart."""
+    bl_idname = "object.distribute_x"
+    bl_label = "Distribute Along X"
+    bl_description = "Space the selected objects or the collection's mesh objects along X, Distance Offset apart, in their current left-to-right order"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        props = context.scene.dist_tool
+        if props.distribute_source == 'COLLECTION':
+            if not props.batch_collection:
+                self.report({'ERROR'}, "Please select a collection")
+                props.result = "Error: Select a collection"
+                return {'CANCELLED'}
+            objects = get_collection_mesh_objects(props.batch_collection)
+        else:
+            objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+
+        if len(objects) < 2:
+            self.report({'ERROR'}, "Need at least two mesh objects to distribute")
+            props.result = "Error: Not enough mesh objects"
+            return {'CANCELLED'}
+
+        mins, maxs = get_cached_world_bounds(objects)
+        shifts = compute_distribution_shifts(mins[:, 0], maxs[:, 0], props.distance_offset)
+        shift_world_x(objects, shifts)
+        props.result = f"Distributed {len(objects)} objects {props.distance_offset:.4f} units apart"
+        self.report({'INFO'}, props.result)
+        return {'FINISHED'}
+
+@timed_operator
+class PickNearestObjectOperator(Operator):
+    """Set Object 2 to the nearest mesh on the right of Object 1."""
+    bl_idname = "object.pick_nearest_object2"
+    bl_label = "Pick Nearest Object 2"
+    bl_description = "Set Object 2 to the nearest mesh whose left side is right of Object 1's right side"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        props = context.scene.dist_tool
+        if not props.obj1:
+            self.report({'ERROR'}, "Please select Object 1")
+            props.result = "Error: Select Object 1"
+            return {'CANCELLED'}
+
+        nearest, gap = _spatial_index.nearest_right(context.scene, props.obj1)
+        if nearest is None:
+            self.report({'WARNING'}, f"No mesh found right of {props.obj1.name}")
+            props.result = "Warning: No mesh to the right"
+            return {'CANCELLED'}
+        props.obj2 = nearest
+        props.distance = gap
+        props.result = f"Object 2: {nearest.name}, X Distance: {gap:.4f} units"
+        self.report({'INFO'}, props.result)
+        return {'FINISHED'}
+
+@timed_operator
+class FindNeighboursOperator(Operator):
+    """Find the nearest right-hand neighbour of every mesh in the scene."""
+    bl_idname = "object.find_neighbours"
+    bl_label = "Find Neighbours"
+    bl_description = "Find the nearest mesh on the right of every mesh in the scene using the spatial index"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        props = context.scene.dist_tool
+        keys, _neighbours, gaps = _spatial_index.right_neighbours(context.scene)
+        if not keys:
+            self.report({'WARNING'}, "No neighbouring meshes found")
+            props.result = "Warning: No neighbours found"
+            return {'CANCELLED'}
+        props.result = f"{len(keys)} of {len(_spatial_index.bounds)} meshes have a right neighbour, closest {gaps.min():.4f} units"
+        self.report({'INFO'}, props.result)
+        return {'FINISHED'}
+
+@timed_operator
+class ClearanceReportOperator(Operator):
+    """Report every pair of meshes in the scene that overlaps or sits closer than Clearance."""
+    bl_idname = "object.clearance_report"
+    bl_label = "Clearance Report"
+    bl_description = "Find overlapping or too-close mesh pairs with sweep-and-prune and stream them into the report list (Esc to stop)"
+    bl_options = {'REGISTER'}
+
+    _timer = None
+    _pairs = None
+    _names = None
+
+    def invoke(self, context, event):
+        return self.execute(context)
+
+    def execute(self, context):
+        props = context.scene.dist_tool
+        objects = [obj for obj in context.scene.objects if obj.type == 'MESH']
+        if len(objects) < 2:
+            self.report({'ERROR'}, "Scene needs at least two mesh objects")
+            props.result = "Error: Not enough mesh objects"
+            return {'CANCELLED'}
+
+        mins, maxs = get_cached_world_bounds(objects)
+        self._names = [obj.name for obj in objects]
+        self._pairs = iter_clearance_pairs(mins, maxs, props.clearance)
+        props.clearance_report.clear()
+        props.clearance_found = 0
+        props.clearance_running = True
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        props = context.scene.dist_tool
+        if event.type == 'ESC':
+            return self._finish(context, "stopped")
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        depsgraph = context.evaluated_depsgraph_get() if props.clearance_refine else None
+        # Work in short slices so the UI keeps redrawing while results stream in
+        deadline = time.perf_counter() + 0.02
+        for i, j, separation in self._pairs:
+            if depsgraph is not None:
+                obj1 = bpy.data.objects.get(self._names[i])
+                obj2 = bpy.data.objects.get(self._names[j])
+                if obj1 is None or obj2 is None:
+                    continue
+                try:
+                    separation = get_surface_distance(obj1, obj2, depsgraph)[0]
+                except ValueError:
+                    continue
+                if separation >= props.clearance and separation > 0.0:
+                    continue
+            props.clearance_found += 1
+            if len(props.clearance_report) < props.clearance_max_items:
+                item = props.clearance_report.add()
+                item.name = self._names[i]
+                item.other = self._names[j]
+                item.distance = separation
+                item.overlap = separation <= 0.0
+            if time.perf_counter() > deadline:
+                break
+        else:
+            return self._finish(context, "done")
+        if context.area:
+            context.area.tag_redraw()
+        return {'RUNNING_MODAL'}
+
+    def _finish(self, context, state):
+        props = context.scene.dist_tool
+        context.window_manager.event_timer_remove(self._timer)
+        self._pairs = None
+        props.clearance_running = False
+        props.result = f"Clearance report {state}: {props.clearance_found} pairs"
+        self.report({'INFO'}, props.result)
+        if context.area:
+            context.area.tag_redraw()
+        return {'FINISHED'}
+
+@timed_operator
+class AddDistanceRuleOperator(Operator):
+    """Add a distance rule from the current Object 1, Object 2, Reference Empty and Empty Cube Target."""
+    bl_idname = "object.add_distance_rule"
+    bl_label = "Add Rule"
+    bl_description = "Add a distance rule using the objects currently picked in the Distance Tool"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        props = context.scene.dist_tool
+        rule = props.rules.add()
+        rule.name = f"Rule {len(props.rules)}"
+        rule.obj1 = props.obj1
+        rule.obj2 = props.obj2
+        rule.reference = props.reference
+        rule.target = props.empty_cube_target
+        rule.distance_offset = props.distance_offset
+        props.active_rule_index = len(props.rules) - 1
+        return {'FINISHED'}
+
+@timed_operator
+class RemoveDistanceRuleOperator(Operator):
+    """Remove the active distance rule."""
+    bl_idname = "object.remove_distance_rule"
+    bl_label = "Remove Rule"
+    bl_description = "Remove the active distance rule"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        props = context.scene.dist_tool
+        if not 0 <= props.active_rule_index < len(props.rules):
+            self.report({'ERROR'}, "No rule selected")
+            return {'CANCELLED'}
+        props.rules.remove(props.active_rule_index)
+        props.active_rule_index = min(props.active_rule_index, len(props.rules) - 1)
+        return {'FINISHED'}
+
+@timed_operator
+class SolveDistanceRulesOperator(Operator):
+    """Solve the scene's distance rules in dependency order."""
+    bl_idname = "object.solve_distance_rules"
+    bl_label = "Solve Rules"
+    bl_description = "Re-position rule targets, re-evaluating only rules downstream of changed objects unless Full is set"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    full: BoolProperty(name="Full", default=False, description="Solve every rule instead of only those affected by changes")
+
+    def execute(self, context):
+        props = context.scene.dist_tool
+        dirty = None if self.full else _rules_state["dirty"]
+        _rules_state["dirty"] = set()
+        try:
+            solved = solve_distance_rules(props.rules, props.measure_mode, dirty)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            props.result = f"Error: {str(e)}"
+            return {'CANCELLED'}
+        props.result = f"Solved {solved} of {len(props.rules)} rules"
+        self.report({'INFO'}, props.result)
+        return {'FINISHED'}
+
+@timed_operator
+class BulkMoveTargetsOperator(Operator):
+    """Move every rule target relative to its reference empty in one pass."""
+    bl_idname = "object.bulk_move_targets"
+    bl_label = "Move All Targets"
+    bl_description = "Move each rule's target by its Object 1 to Object 2 distance along Move Axis plus its offset, away from its reference empty"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        props = context.scene.dist_tool
+        try:
+            moved = bulk_move_rule_targets(props.rules, props.measure_mode, "XYZ".index(props.move_axis))
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            props.result = f"Error: {str(e)}"
+            return {'CANCELLED'}
+        props.result = f"Moved {moved} rule targets along {props.move_axis}"
+        self.report({'INFO'}, props.result)
+        return {'FINISHED'}
+
+@timed_operator
+class BulkResetTargetsOperator(Operator):
+    """Reset every rule target to its original location in one pass."""
+    bl_idname = "object.bulk_reset_targets"
+    bl_label = "Reset All Targets"
+    bl_description = "Return each rule's target to the location it had before it was moved"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        props = context.scene.dist_tool
+        reset = bulk_reset_rule_targets(props.rules)
+        props.result = f"Reset {reset} rule targets"
+        self.report({'INFO'}, props.result)
+        return {'FINISHED'}
+
+@timed_operator
+class ClearDistanceCachesOperator(Operator):
+    """Clear the Distance Tool's bounds, hull and BVH caches."""
+    bl_idname = "object.clear_distance_caches"
+    bl_label = "Clear Caches"
+    bl_description = "Clear cached bounds, hulls and BVH trees and reset the cache counters"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        clear_distance_caches()
+        self.report({'INFO'}, "Distance Tool caches cleared")
+        return {'FINISHED'}
+
+@timed_operator
+class ClearStoredMeasurementsOperator(Operator):
+    """Remove the measurements persisted in the current scene."""
+    bl_idname = "object.clear_stored_measurements"
+    bl_label = "Clear Stored Measurements"
+    bl_description = "Remove the exact and surface measurements saved in this scene, forcing them to be recomputed"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        count = clear_stored_measurements(context.scene)
+        self.report({'INFO'}, f"Removed {count} stored measurements")
+        return {'FINISHED'}
+
+class ResetTimingsOperator(Operator):
+    """Clear the per-operator timing counters."""
+    bl_idname = "object.reset_distance_timings"
+    bl_label = "Reset Timings"
+    bl_description = "Clear the call count, total and max time recorded for every operator"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        reset_timings()
+        self.report({'INFO'}, "Operator timings cleared")
+        return {'FINISHED'}
+
+class ExportTimingsOperator(Operator, ExportHelper):
+    """Export the per-operator timing counters to a JSON file."""
+    bl_idname = "object.export_distance_timings"
+    bl_label = "Export Timings"
+    bl_description = "Write the call count, total, mean and max time of every operator to a JSON file"
+    bl_options = {'REGISTER'}
+
+    filename_ext = ".json"
+    filter_glob: StringProperty(default="*.json", options={'HIDDEN'})
+
+    def execute(self, context):
+        try:
+            count = export_timings(self.filepath)
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not write {self.filepath}: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Exported {count} operator timings to {self.filepath}")
+        return {'FINISHED'}
+
+@timed_operator
 class ResetPositionOperator(Operator):
     """Reset Empty Cube Target to its original position."""
     bl_idname = "object.reset_position"
@@ -138,9 +1878,44 @@ class ResetPositionOperator(Operator):
         props.empty_cube_target.location = props.original_location
         props.result = "Empty Cube Target position reset"
         self.report({'INFO'}, props.result)
-        print(f"DEBUG: Reset {props.empty_cube_target.name} to {props.original_location}")
+        logger.debug("Reset %s to %s", props.empty_cube_target.name, tuple(props.original_location))
         return {'FINISHED'}
 
+class DistanceRule(PropertyGroup):
+    enabled: BoolProperty(name="Enabled", default=True)
+    obj1: PointerProperty(type=bpy.types.Object, name="Object 1")
+    obj2: PointerProperty(type=bpy.types.Object, name="Object 2")
+    reference: PointerProperty(type=bpy.types.Object, name="Reference Empty")
+    target: PointerProperty(
+        type=bpy.types.Object,
+        name="Target",
+        update=update_rule_target_location
+    )
+    distance_offset: FloatProperty(name="Distance Offset", default=0.0, precision=4, description="Additional distance to move the target")
+    distance: FloatProperty(name="X Distance", default=0.0, precision=4, description="X-distance measured by the last solve")
+    original_location: FloatVectorProperty(name="Original Location", size=3, default=(0, 0, 0))
+
+class DISTANCE_UL_rules(UIList):
+    """List of distance rules with their last measured X-distance."""
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.prop(item, "enabled", text="")
+        row.prop(item, "name", text="", emboss=False)
+        row.label(text=f"{item.distance:.4f}")
+
+class ClearanceReportItem(PropertyGroup):
+    other: StringProperty(name="Other Object")
+    distance: FloatProperty(name="Distance", precision=4)
+    overlap: BoolProperty(name="Overlap", default=False)
+
+class DISTANCE_UL_clearance(UIList):
+    """List of mesh pairs found by the clearance report."""
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        layout.label(text=f"{item.name} / {item.other}", icon='ERROR' if item.overlap else 'INFO')
+        layout.label(text=f"{item.distance:.4f}")
+
 class DistanceToolProperties(PropertyGroup):
     obj1: PointerProperty(type=bpy.types.Object, name="Object 1")
     obj2: PointerProperty(type=bpy.types.Object, name="Object 2")
@@ -150,10 +1925,77 @@ class DistanceToolProperties(PropertyGroup):
         name="Empty Cube Target",
         update=update_empty_cube_target_location
     )
+    measure_mode: EnumProperty(
+        name="Measure Mode",
+        items=[
+            ('BOUNDS', "Bounding Box", "Measure between the objects' world-space bounding boxes"),
+            ('EXACT', "Exact Extent", "Measure between the objects' extreme vertices, supporting rotation and scale"),
+        ],
+        default='BOUNDS'
+    )
     distance: FloatProperty(name="X Distance", default=0.0, precision=4, description="Measured X-axis distance between Object 1's right side and Object 2's left side")
+    distance_y: FloatProperty(name="Y Distance", default=0.0, precision=4, description="Measured signed Y-axis distance from Object 1 to Object 2")
+    distance_z: FloatProperty(name="Z Distance", default=0.0, precision=4, description="Measured signed Z-axis distance from Object 1 to Object 2")
+    distance_euclid: FloatProperty(name="Separation", default=0.0, precision=4, description="Euclidean distance between the bounds of Object 1 and Object 2")
+    move_axis: EnumProperty(
+        name="Move Axis",
+        items=[
+            ('X', "X", "Measure and move along X"),
+            ('Y', "Y", "Measure and move along Y"),
+            ('Z', "Z", "Measure and move along Z"),
+        ],
+        default='X'
+    )
+    surface_distance: FloatProperty(name="Surface Distance", default=0.0, precision=4, description="Minimum distance between the surfaces of Object 1 and Object 2")
+    surface_point1: FloatVectorProperty(name="Closest Point 1", size=3, subtype='TRANSLATION', description="Closest point on Object 1")
+    surface_point2: FloatVectorProperty(name="Closest Point 2", size=3, subtype='TRANSLATION', description="Closest point on Object 2")
     distance_offset: FloatProperty(name="Distance Offset", default=0.0, precision=4, description="Additional distance to move Empty Cube Target")
+    target_gap: FloatProperty(name="Target Gap", default=0.0, precision=4, description="X-distance between Object 1 and Object 2 that Solve to Gap converges to")
+    solve_tolerance: FloatProperty(name="Tolerance", default=1e-4, min=1e-7, precision=6, description="Largest accepted difference between the measured and target gap")
+    solve_max_iterations: IntProperty(name="Max Evaluations", default=10, min=2, max=100, description="Maximum number of scene evaluations Solve to Gap may use")
+    solve_evaluations: IntProperty(name="Evaluations", default=0, description="Scene evaluations used by the last Solve to Gap")
+    bake_frame_start: IntProperty(name="Start", default=1, description="First frame to bake")
+    bake_frame_end: IntProperty(name="End", default=250, description="Last frame to bake")
+    background_running: BoolProperty(name="Background Running", default=False)
+    background_progress: FloatProperty(name="Progress", default=0.0, min=0.0, max=1.0, subtype='FACTOR')
+    live_adjust: BoolProperty(
+        name="Live Auto-Adjust",
+        default=False,
+        description="Keep Empty Cube Target gap-locked while Object 1, Object 2 or the Reference Empty move",
+        update=update_live_adjust
+    )
     original_location: FloatVectorProperty(name="Original Location", size=3, default=(0, 0, 0))
+    log_level: EnumProperty(
+        name="Log Level",
+        items=[(level, level.title(), f"Log {level.lower()} messages and above" if level != 'OFF' else "Do not log anything")
+               for level in LOG_LEVELS],
+        default='OFF',
+        description="Console logging level shared by the Distance Tool add-ons",
+        update=update_log_level
+    )
     result: StringProperty(name="Result", default="No result yet", description="Result of the last operation")
+    batch_collection: PointerProperty(type=bpy.types.Collection, name="Collection", description="Collection whose mesh objects are measured in one batch")
+    batch_count: IntProperty(name="Measured Objects", default=0)
+    batch_min_gap: FloatProperty(name="Min Gap", default=0.0, precision=4, description="Smallest X-distance between neighbouring objects")
+    batch_max_gap: FloatProperty(name="Max Gap", default=0.0, precision=4, description="Largest X-distance between neighbouring objects")
+    batch_overlaps: IntProperty(name="Overlaps", default=0, description="Number of neighbouring pairs that overlap along X")
+    distribute_source: EnumProperty(
+        name="Distribute",
+        items=[
+            ('SELECTED', "Selected", "Distribute the selected mesh objects"),
+            ('COLLECTION', "Collection", "Distribute the mesh objects of the batch collection"),
+        ],
+        default='SELECTED'
+    )
+    clearance: FloatProperty(name="Clearance", default=0.0, min=0.0, precision=4, description="Report mesh pairs closer than this distance; 0 reports only overlaps")
+    clearance_refine: BoolProperty(name="Refine with Geometry", default=False, description="Confirm bounding box candidates with the exact surface distance")
+    clearance_max_items: IntProperty(name="Max Listed", default=1000, min=1, description="Maximum number of pairs kept in the report list")
+    clearance_report: CollectionProperty(type=ClearanceReportItem, name="Clearance Report")
+    clearance_report_index: IntProperty(name="Active Report Item", default=0)
+    clearance_found: IntProperty(name="Pairs Found", default=0)
+    clearance_running: BoolProperty(name="Report Running", default=False)
+    rules: CollectionProperty(type=DistanceRule, name="Distance Rules")
+    active_rule_index: IntProperty(name="Active Rule", default=0)
 
 class DistanceToolPanel(Panel):
     """Panel in 3D Viewport > Sidebar > Distance Tool to calculate X-distance and move Empty Cube Target."""
@@ -169,24 +2011,163 @@ class DistanceToolPanel(Panel):
 
         layout.prop(props, "obj1")
         layout.prop(props, "obj2")
+        layout.operator("object.pick_nearest_object2")
         layout.prop(props, "reference")
         layout.prop(props, "empty_cube_target")
         layout.prop(props, "distance_offset")
+        layout.prop(props, "measure_mode")
         layout.operator("object.measure_distance")
         layout.label(text=f"X Distance: {props.distance:.4f}")
+        layout.label(text=f"Y: {props.distance_y:.4f}  Z: {props.distance_z:.4f}  Separation: {props.distance_euclid:.4f}")
+        layout.operator("object.measure_surface_distance")
+        row = layout.row(align=True)
+        if props.background_running:
+            row.label(text=f"Measuring... {props.background_progress * 100:.0f}%")
+            row.operator("object.cancel_background_measure", icon='CANCEL')
+        row.operator("object.measure_distance_background")
+        layout.label(text=f"Surface Distance: {props.surface_distance:.4f}")
+        row = layout.row(align=True)
+        row.prop(props, "move_axis", expand=True)
         layout.operator("object.move_object")
+        box = layout.box()
+        box.prop(props, "target_gap")
+        row = box.row(align=True)
+        row.prop(props, "solve_tolerance")
+        row.prop(props, "solve_max_iterations")
+        box.operator("object.solve_to_gap")
+        if props.solve_evaluations:
+            box.label(text=f"Evaluations: {props.solve_evaluations}")
+        layout.prop(props, "live_adjust")
+        row = layout.row(align=True)
+        row.prop(props, "bake_frame_start")
+        row.prop(props, "bake_frame_end")
+        layout.operator("object.bake_auto_adjust")
         layout.operator("object.reset_position")
         layout.label(text=props.result)
 
+        box = layout.box()
+        box.label(text="Batch", icon='OUTLINER_COLLECTION')
+        box.prop(props, "batch_collection")
+        box.operator("object.measure_distance_batch")
+        box.operator("object.find_neighbours")
+        row = box.row(align=True)
+        row.prop(props, "distribute_source", text="")
+        row.operator("object.distribute_x")
+        box.operator("object.export_distance_report")
+        if props.batch_count:
+            box.label(text=f"Objects: {props.batch_count}  Overlaps: {props.batch_overlaps}")
+            box.label(text=f"Gaps: {props.batch_min_gap:.4f} .. {props.batch_max_gap:.4f}")
+
+        box = layout.box()
+        box.label(text="Clearance", icon='MOD_PHYSICS')
+        row = box.row(align=True)
+        row.prop(props, "clearance")
+        row.prop(props, "clearance_refine", text="", icon='MESH_DATA')
+        box.operator("object.clearance_report")
+        if props.clearance_running or props.clearance_found:
+            box.label(text=f"Pairs: {props.clearance_found}{' (running)' if props.clearance_running else ''}")
+            box.template_list("DISTANCE_UL_clearance", "", props, "clearance_report", props, "clearance_report_index", rows=4)
+
+        box = layout.box()
+        box.label(text="Rules", icon='LINKED')
+        row = box.row()
+        row.template_list("DISTANCE_UL_rules", "", props, "rules", props, "active_rule_index", rows=3)
+        col = row.column(align=True)
+        col.operator("object.add_distance_rule", icon='ADD', text="")
+        col.operator("object.remove_distance_rule", icon='REMOVE', text="")
+        if 0 <= props.active_rule_index < len(props.rules):
+            rule = props.rules[props.active_rule_index]
+            box.prop(rule, "obj1")
+            box.prop(rule, "obj2")
+            box.prop(rule, "reference")
+            box.prop(rule, "target")
+            box.prop(rule, "distance_offset")
+        row = box.row(align=True)
+        row.operator("object.solve_distance_rules", text="Solve Changed").full = False
+        row.operator("object.solve_distance_rules", text="Solve All").full = True
+        row = box.row(align=True)
+        row.operator("object.bulk_move_targets")
+        row.operator("object.bulk_reset_targets")
+
+        stats = get_bounds_cache_stats()
+        box = layout.box()
+        box.label(text=f"Bounds cache: {stats['hits']} hits, {stats['misses']} misses, {stats['size']} entries", icon='INFO')
+        box.operator("object.clear_distance_caches")
+        store = context.scene.get(MEASUREMENT_STORE)
+        box.label(text=f"Stored measurements: {len(store) if store is not None else 0}")
+        box.operator("object.clear_stored_measurements")
+
+class DistanceToolDiagnosticsPanel(Panel):
+    """Sub-panel showing the log level and per-operator timing counters."""
+    bl_label = "Diagnostics"
+    bl_idname = "VIEW3D_PT_distance_tool_diagnostics"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'Distance Tool'
+    bl_parent_id = "VIEW3D_PT_distance_tool"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.dist_tool
+
+        layout.prop(props, "log_level")
+        timings = get_timings()
+        if timings:
+            col = layout.column(align=True)
+            for row in timings:
+                col.label(text=f"{row['name']}: {row['count']}x  total {row['total'] * 1000:.1f} ms  max {row['max'] * 1000:.1f} ms")
+        else:
+            layout.label(text="No operator calls recorded")
+        row = layout.row(align=True)
+        row.operator("object.reset_distance_timings")
+        row.operator("object.export_distance_timings")
+
 def register():
     print("Registering Distance Tool classes")
     try:
         bpy.utils.register_class(DistanceOperator)
         bpy.utils.register_class(MoveObjectOperator)
+        bpy.utils.register_class(SolveToGapOperator)
+        bpy.utils.register_class(BakeAutoAdjustOperator)
+        bpy.utils.register_class(BackgroundMeasureOperator)
+        bpy.utils.register_class(CancelBackgroundMeasureOperator)
+        bpy.utils.register_class(SurfaceDistanceOperator)
+        bpy.utils.register_class(BatchDistanceOperator)
+        bpy.utils.register_class(ExportMeasurementsOperator)
+        bpy.utils.register_class(ClearDistanceCachesOperator)
+        bpy.utils.register_class(ClearStoredMeasurementsOperator)
+        bpy.utils.register_class(DistributeXOperator)
+        bpy.utils.register_class(PickNearestObjectOperator)
+        bpy.utils.register_class(FindNeighboursOperator)
+        bpy.utils.register_class(ClearanceReportOperator)
+        bpy.utils.register_class(AddDistanceRuleOperator)
+        bpy.utils.register_class(RemoveDistanceRuleOperator)
+        bpy.utils.register_class(SolveDistanceRulesOperator)
+        bpy.utils.register_class(BulkMoveTargetsOperator)
+        bpy.utils.register_class(BulkResetTargetsOperator)
         bpy.utils.register_class(ResetPositionOperator)
+        bpy.utils.register_class(ResetTimingsOperator)
+        bpy.utils.register_class(ExportTimingsOperator)
+        bpy.utils.register_class(DistanceRule)
+        bpy.utils.register_class(DISTANCE_UL_rules)
+        bpy.utils.register_class(ClearanceReportItem)
+        bpy.utils.register_class(DISTANCE_UL_clearance)
         bpy.utils.register_class(DistanceToolProperties)
         bpy.utils.register_class(DistanceToolPanel)
+        bpy.utils.register_class(DistanceToolDiagnosticsPanel)
         bpy.types.Scene.dist_tool = PointerProperty(type=DistanceToolProperties)
+        # Re-running the script leaves the previous run's persistent handlers bound to its own caches
+        _remove_stale_handlers(bpy.app.handlers.depsgraph_update_post, _on_live_depsgraph_update.__name__)
+        for handlers, handler in (
+            (bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update),
+            (bpy.app.handlers.frame_change_post, _on_frame_change_post),
+            (bpy.app.handlers.load_post, _on_load_post),
+            (bpy.app.handlers.undo_post, _on_load_post),
+            (bpy.app.handlers.redo_post, _on_load_post),
+        ):
+            _remove_stale_handlers(handlers, handler.__name__)
+            handlers.append(handler)
         print("Registration successful")
     except Exception as e:
         print(f"Registration failed: {str(e)}")
@@ -196,10 +2177,47 @@ def unregister():
     try:
         bpy.utils.unregister_class(DistanceOperator)
         bpy.utils.unregister_class(MoveObjectOperator)
+        bpy.utils.unregister_class(SolveToGapOperator)
+        bpy.utils.unregister_class(BakeAutoAdjustOperator)
+        bpy.utils.unregister_class(BackgroundMeasureOperator)
+        bpy.utils.unregister_class(CancelBackgroundMeasureOperator)
+        bpy.utils.unregister_class(SurfaceDistanceOperator)
+        bpy.utils.unregister_class(BatchDistanceOperator)
+        bpy.utils.unregister_class(ExportMeasurementsOperator)
+        bpy.utils.unregister_class(ClearDistanceCachesOperator)
+        bpy.utils.unregister_class(ClearStoredMeasurementsOperator)
+        bpy.utils.unregister_class(DistributeXOperator)
+        bpy.utils.unregister_class(PickNearestObjectOperator)
+        bpy.utils.unregister_class(FindNeighboursOperator)
+        bpy.utils.unregister_class(ClearanceReportOperator)
+        bpy.utils.unregister_class(AddDistanceRuleOperator)
+        bpy.utils.unregister_class(RemoveDistanceRuleOperator)
+        bpy.utils.unregister_class(SolveDistanceRulesOperator)
+        bpy.utils.unregister_class(BulkMoveTargetsOperator)
+        bpy.utils.unregister_class(BulkResetTargetsOperator)
         bpy.utils.unregister_class(ResetPositionOperator)
+        bpy.utils.unregister_class(ResetTimingsOperator)
+        bpy.utils.unregister_class(ExportTimingsOperator)
         bpy.utils.unregister_class(DistanceToolProperties)
+        bpy.utils.unregister_class(DISTANCE_UL_clearance)
+        bpy.utils.unregister_class(ClearanceReportItem)
+        bpy.utils.unregister_class(DISTANCE_UL_rules)
+        bpy.utils.unregister_class(DistanceRule)
+        bpy.utils.unregister_class(DistanceToolDiagnosticsPanel)
         bpy.utils.unregister_class(DistanceToolPanel)
         del bpy.types.Scene.dist_tool
+        if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+        _sync_live_handler(False)
+        cancel_background_measurement()
+        if bpy.app.timers.is_registered(_poll_background_job):
+            bpy.app.timers.unregister(_poll_background_job)
+        shutdown_pool()
+        if _on_frame_change_post in bpy.app.handlers.frame_change_post:
+            bpy.app.handlers.frame_change_post.remove(_on_frame_change_post)
+        for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+            if _on_load_post in handlers:
+                handlers.remove(_on_load_post)
         print("Unregistration successful")
     except Exception as e:
         print(f"Unregistration failed: {str(e)}")
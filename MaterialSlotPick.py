@@ -1,13 +1,68 @@
 import bpy 
-from bpy.props import PointerProperty
+import os
+import sys
+import numpy as np
+from bpy.props import PointerProperty, IntProperty, EnumProperty
+# Scripts run from the Text Editor do not have their folder on sys.path, so add it for tool_logging
+_script_dir = os.path.dirname(os.path.abspath(__file__))
+if _script_dir not in sys.path:
+    sys.path.insert(0, _script_dir)
+from tool_logging import timed_operator
+
+# Assign mat to one material slot of every datablock used by objects, writing each shared datablock only once
+def assign_material_bulk(objects, mat, slot = 0, faces = 'NONE'):
+    """Return a summary dict of objects, datablocks, changed slots, retargeted faces and skipped objects.
+
+    Any object whose data has material slots (meshes, curves, text, surfaces, metaballs) is assigned, each
+    shared datablock once. faces is 'NONE', 'ALL' or 'SELECTED': which faces of each mesh get
+    material_index = slot, written with one foreach_set per mesh.
+    """
+    datablocks = {}
+    skipped = 0
+    for obj in objects:
+        if getattr(obj.data, "materials", None) is None:
+            skipped += 1
+            continue
+        datablocks.setdefault(obj.data.as_pointer(), obj.data)
+    
+    changed = 0
+    retargeted = 0
+    for data in datablocks.values():
+        materials = data.materials
+        while len(materials) <= slot:
+            materials.append(None)
+        if materials[slot] != mat:
+            materials[slot] = mat
+            changed += 1
+        # Only meshes have per-face material indices
+        if faces == 'NONE' or not isinstance(data, bpy.types.Mesh) or not len(data.polygons):
+            continue
+        
+        count = len(data.polygons)
+        indices = np.empty(count, dtype = np.int32)
+        data.polygons.foreach_get("material_index", indices)
+        update = indices != slot
+        if faces == 'SELECTED':
+            selected = np.empty(count, dtype = bool)
+            data.polygons.foreach_get("select", selected)
+            update &= selected
+        if update.any():
+            indices[update] = slot
+            data.polygons.foreach_set("material_index", indices)
+            data.update()
+            retargeted += int(update.sum())
+    return {
+        "objects": len(objects) - skipped,
+        "datablocks": len(datablocks),
+        "changed": changed,
+        "faces": retargeted,
+        "skipped": skipped,
+    }
 
 # Function to assign material to object and show feedback
 def assign_material(obj, mat, obj_name, mat_name):
     if obj and mat:
-        if obj.data.materials:
-            obj.data.materials[0] = mat
-        else:
-            obj.data.materials.append(mat)
+        assign_material_bulk([obj], mat)
         # Show feedback in Blender UI
         bpy.context.window_manager.popup_menu(
             lambda self, ctx: self.layout.label(text=f"Assigned {mat.name} to {obj.name}"),
@@ -74,6 +129,44 @@ bpy.types.Scene.material2 = PointerProperty(
     name = "Material 2",
     update = update_material2
     )        
+bpy.types.Scene.bulk_material = PointerProperty(
+    type = bpy.types.Material,
+    name = "Bulk Material"
+    )
+
+@timed_operator
+class OBJECTPICKER_OT_assign_material_bulk(bpy.types.Operator):
+    """Assign the bulk material to every selected object with material slots, writing each shared datablock once"""
+    bl_idname = "object.assign_material_bulk"
+    bl_label = "Assign to Selected"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    slot: IntProperty(name = "Slot", default = 0, min = 0, description = "Material slot to fill")
+    faces: EnumProperty(
+        name = "Faces",
+        items = [
+            ('NONE', "Keep", "Leave face material indices unchanged"),
+            ('ALL', "All Faces", "Point every face at the slot"),
+            ('SELECTED', "Selected Faces", "Point the selected faces at the slot"),
+        ],
+        default = 'NONE'
+    )
+    
+    def execute(self, context):
+        mat = context.scene.bulk_material
+        if not mat:
+            self.report({'ERROR'}, "No material selected")
+            return {'CANCELLED'}
+        if not context.selected_objects:
+            self.report({'ERROR'}, "No objects selected")
+            return {'CANCELLED'}
+        
+        summary = assign_material_bulk(context.selected_objects, mat, self.slot, self.faces)
+        self.report({'INFO'}, (
+            f"Assigned {mat.name} to {summary['objects']} objects using {summary['datablocks']} datablocks: "
+            f"{summary['changed']} slots changed, {summary['faces']} faces retargeted, {summary['skipped']} without materials skipped"
+        ))
+        return {'FINISHED'}
     
 class OBJECTPICKER_PT_Panel(bpy.types.Panel):
     bl_label = "Object Picker Panel"
@@ -98,9 +191,17 @@ class OBJECTPICKER_PT_Panel(bpy.types.Panel):
         layout.prop(scene, "material1", text = "Material for object1")
         layout.prop(scene, "material2", text = "Material for object2")
         
+        box = layout.box()
+        box.label(text = "Bulk Assign", icon = 'MATERIAL')
+        box.prop(scene, "bulk_material", text = "")
+        row = box.row(align = True)
+        row.operator("object.assign_material_bulk").faces = 'NONE'
+        row.operator("object.assign_material_bulk", text = "All Faces").faces = 'ALL'
+        
 
 #Register classes
 classes = (
+    OBJECTPICKER_OT_assign_material_bulk,
     OBJECTPICKER_PT_Panel,
 )
 
@@ -117,6 +218,7 @@ def unregister():
     del bpy.types.Scene.target2
     del bpy.types.Scene.material1
     del bpy.types.Scene.material2
+    del bpy.types.Scene.bulk_material
 
 if __name__ == "__main__":
     register()        
\ No newline at end of file
@@ -20,7 +20,7 @@ def set_mirror_object(mirror_object_name = 'Centre-Target'):
             has_mirror = True
             #Assign the mirror object
             modifier.mirror_object = mirror_obj
-            print(f"Assigned '{mirror_object_name}' to Mirror Modifier of {obj.name}'")
+            print(f"Assigned '{mirror_object_name}' to Mirror Modifier of '{obj.name}'")
             break
     
     if not has_mirror:
@@ -1,6 +1,50 @@
 import bpy
 from mathutils import Vector
+from collections import deque
+import itertools
 import math
+import os
+import struct
+import sys
+import numpy as np
+# Scripts run from the Text Editor do not have their folder on sys.path, so add it for tool_logging
+_script_dir = os.path.dirname(os.path.abspath(__file__))
+if _script_dir not in sys.path:
+    sys.path.insert(0, _script_dir)
+from tool_logging import logger, timed_operator
+
+#Scene ID property holding named snapshots: {name: {"names": joined object names, "transforms": SNAPSHOT_WIDTH floats per object}}
+SNAPSHOT_STORE = "transform_snapshots"
+#Separates object names inside a snapshot's "names" string
+NAME_SEPARATOR = "\x1f"
+#Bulk-read attributes and their sizes; every rotation representation is kept so objects in any rotation mode restore exactly
+TRANSFORM_ATTRIBUTES = (("location", 3), ("rotation_euler", 3), ("rotation_quaternion", 4), ("rotation_axis_angle", 4), ("scale", 3))
+TRANSFORM_WIDTH = sum(size for _attribute, size in TRANSFORM_ATTRIBUTES)
+#Snapshot rows end with the object's rotation_mode as an index into ROTATION_MODES
+ROTATION_MODES = ('QUATERNION', 'XYZ', 'XZY', 'YXZ', 'YZX', 'ZXY', 'ZYX', 'AXIS_ANGLE')
+SNAPSHOT_WIDTH = TRANSFORM_WIDTH + 1
+
+#Recent nudges as (object name, axis index, distance); the oldest fall off once the buffer is full
+NUDGE_HISTORY_SIZE = 64
+_nudge_history = deque(maxlen = NUDGE_HISTORY_SIZE)
+#Keys that nudge forwards and backwards in the modal nudge operator
+NUDGE_FORWARD_KEYS = {'RIGHT_ARROW', 'UP_ARROW', 'NUMPAD_PLUS', 'WHEELUPMOUSE'}
+NUDGE_BACKWARD_KEYS = {'LEFT_ARROW', 'DOWN_ARROW', 'NUMPAD_MINUS', 'WHEELDOWNMOUSE'}
+
+#Binary snapshot library: header, then per snapshot a name blob and a float32 (n, SNAPSHOT_WIDTH) transform array, then a fixed-size index
+LIBRARY_MAGIC = b"TSNAPLIB"
+LIBRARY_VERSION = 2
+#Magic, version, snapshot count, index offset
+LIBRARY_HEADER = struct.Struct("<8sIIQ")
+#Longest snapshot name a library can hold, in UTF-8 bytes
+LIBRARY_NAME_BYTES = 64
+LIBRARY_INDEX_DTYPE = np.dtype([
+    ("name", f"S{LIBRARY_NAME_BYTES}"),
+    ("count", "<u8"),
+    ("names_offset", "<u8"),
+    ("names_length", "<u8"),
+    ("data_offset", "<u8"),
+])
 
 class ObjectLocationPropertyGroup(bpy.types.PropertyGroup):
     saved_location: bpy.props.FloatVectorProperty(
@@ -27,6 +71,14 @@ def get_active_move_object(context):
         return scene.object_slot_2
     return None
 
+#Show or hide a slot object, writing only the flags that differ so unchanged objects are not re-tagged
+def set_slot_visibility(obj, visible):
+    if obj.hide_get() == visible:
+        obj.hide_set(not visible) #Hidden in viewport unless visible
+    for flag in ("hide_viewport", "hide_render", "hide_select"):
+        if getattr(obj, flag):
+            setattr(obj, flag, False)
+
 #Auto-hide inactive slot object
 def update_active_slot(self, context):
     active_obj = get_active_move_object(context)
@@ -34,17 +86,593 @@ def update_active_slot(self, context):
     
     for obj in [context.scene.object_slot_1, context.scene.object_slot_2]:
         if obj:
-            if obj == active_obj:
-                obj.hide_set(False) #Visible in viewport
-                obj.hide_viewport = False
-                obj.hide_render = False
-                obj.hide_select = False        
-            else:
-                obj.hide_set(True) #Hidden in viewport
-                obj.hide_viewport = False
-                obj.hide_render = False
-                obj.hide_select = False
+            set_slot_visibility(obj, obj == active_obj)
+
+#Slot groups: any number of groups, each with any number of variant objects of which one is shown
+class SlotItem(bpy.types.PropertyGroup):
+    object: bpy.props.PointerProperty(type = bpy.types.Object, name = "Object")
+
+def switch_slot_group(group, index):
+    """Show variant index of group and hide the one shown before, touching only those two objects."""
+    if index == group.shown_index:
+        return False
+    slots = group.slots
+    outgoing = slots[group.shown_index].object if 0 <= group.shown_index < len(slots) else None
+    incoming = slots[index].object if 0 <= index < len(slots) else None
+    if outgoing and outgoing != incoming:
+        set_slot_visibility(outgoing, False)
+    if incoming:
+        set_slot_visibility(incoming, True)
+    group.shown_index = index
+    return True
+
+def update_slot_group_variant(self, context):
+    switch_slot_group(self, self.active_index)
+
+class SlotGroup(bpy.types.PropertyGroup):
+    slots: bpy.props.CollectionProperty(type = SlotItem)
+    active_index: bpy.props.IntProperty(
+        name = "Active Variant",
+        default = 0,
+        update = update_slot_group_variant
+    )
+    #Variant currently visible, or -1 when none has been shown yet
+    shown_index: bpy.props.IntProperty(default = -1)
+
+def switch_all_slot_groups(groups, variant):
+    """Switch every group that has variant to it and return how many groups changed."""
+    switched = 0
+    for group in groups:
+        if variant < len(group.slots):
+            switched += switch_slot_group(group, variant)
+            group.active_index = variant
+    return switched
 
+#Bulk transform access: one foreach_get/foreach_set per attribute for every object in the file
+def read_all_transforms():
+    """Return (object names, (n, TRANSFORM_WIDTH) array of location, rotations and scale) for every object in bpy.data."""
+    objects = bpy.data.objects
+    n = len(objects)
+    transforms = np.empty((n, TRANSFORM_WIDTH), dtype = np.float32)
+    start = 0
+    for attribute, size in TRANSFORM_ATTRIBUTES:
+        values = np.empty(n * size, dtype = np.float32)
+        objects.foreach_get(attribute, values)
+        transforms[:, start:start + size] = values.reshape(n, size)
+        start += size
+    return objects.keys(), transforms
+
+def write_all_transforms(transforms, changed):
+    """Write an (n, TRANSFORM_WIDTH) transform array back to every object in bpy.data and tag the changed object indices for update."""
+    objects = bpy.data.objects
+    start = 0
+    for attribute, size in TRANSFORM_ATTRIBUTES:
+        objects.foreach_set(attribute, np.ascontiguousarray(transforms[:, start:start + size]).ravel())
+        start += size
+    for i in changed:
+        objects[i].update_tag(refresh = {'OBJECT'})
+
+def get_snapshot_store(scene, create = False):
+    store = scene.get(SNAPSHOT_STORE)
+    if store is None and create:
+        scene[SNAPSHOT_STORE] = {}
+        store = scene[SNAPSHOT_STORE]
+    return store
+
+def save_snapshot(scene, name, objects):
+    """Store the location, rotation, scale and rotation mode of objects under name as one flat float array."""
+    names, transforms = read_all_transforms()
+    index = {object_name: i for i, object_name in enumerate(names)}
+    rows = [index[obj.name] for obj in objects]
+    modes = [ROTATION_MODES.index(obj.rotation_mode) for obj in objects]
+    get_snapshot_store(scene, create = True)[name] = {
+        "names": NAME_SEPARATOR.join(obj.name for obj in objects),
+        "transforms": np.column_stack((transforms[rows], modes)).ravel().tolist(),
+    }
+    return len(rows)
+
+def apply_transforms(snapshot_names, values, only = None):
+    """Write rows of an (n, SNAPSHOT_WIDTH) snapshot array to the objects named by snapshot_names in one bulk pass.
+
+    With only (a set of object names) the other objects are left alone. Only the rows actually applied are
+    read from values, so a memory-mapped array is paged in partially. Returns (restored, missing) counts.
+    """
+    names, transforms = read_all_transforms()
+    index = {object_name: i for i, object_name in enumerate(names)}
+    wanted = [row for row, object_name in enumerate(snapshot_names) if only is None or object_name in only]
+    rows = [row for row in wanted if snapshot_names[row] in index]
+    columns = [index[snapshot_names[row]] for row in rows]
+    applied = values[rows]
+    #Changing rotation_mode converts the rotation, so modes go first and the bulk write below overwrites every representation
+    objects = bpy.data.objects
+    for column, mode in zip(columns, applied[:, TRANSFORM_WIDTH].astype(int).tolist()):
+        if objects[column].rotation_mode != ROTATION_MODES[mode]:
+            objects[column].rotation_mode = ROTATION_MODES[mode]
+    transforms[columns] = applied[:, :TRANSFORM_WIDTH]
+    write_all_transforms(transforms, columns)
+    return len(rows), len(wanted) - len(rows)
+
+def recall_snapshot(scene, name, only = None):
+    """Restore the objects of snapshot name in one bulk write and return (restored, missing) counts."""
+    entry = get_snapshot_store(scene)[name]
+    values = np.array(entry["transforms"], dtype = np.float32).reshape(-1, SNAPSHOT_WIDTH)
+    return apply_transforms(entry["names"].split(NAME_SEPARATOR), values, only)
+
+def delete_snapshot(scene, name):
+    store = get_snapshot_store(scene)
+    if store is not None and name in store:
+        del store[name]
+
+class SnapshotLibrary:
+    """Read-only, memory-mapped view of a snapshot library file; transform arrays are only paged in when used."""
+    
+    def __init__(self, path):
+        self.path = path
+        self._map = np.memmap(path, dtype = np.uint8, mode = 'r')
+        if len(self._map) < LIBRARY_HEADER.size:
+            raise ValueError(f"{path} is not a snapshot library")
+        magic, version, count, index_offset = LIBRARY_HEADER.unpack_from(self._map, 0)
+        if magic != LIBRARY_MAGIC or version != LIBRARY_VERSION:
+            raise ValueError(f"{path} is not a snapshot library")
+        self.index = np.frombuffer(self._map, dtype = LIBRARY_INDEX_DTYPE, count = count, offset = index_offset)
+    
+    def names(self):
+        return [name.decode("utf-8", errors = "ignore") for name in self.index["name"]]
+    
+    def find(self, name):
+        """Return the index of snapshot name, raising KeyError if the library does not contain it."""
+        encoded = name.encode("utf-8")
+        matches = np.flatnonzero(self.index["name"] == encoded) if len(encoded) <= LIBRARY_NAME_BYTES else []
+        if not len(matches):
+            raise KeyError(name)
+        return int(matches[-1])
+    
+    def object_names(self, i):
+        entry = self.index[i]
+        start = int(entry["names_offset"])
+        blob = bytes(self._map[start:start + int(entry["names_length"])]).decode("utf-8")
+        return blob.split(NAME_SEPARATOR) if blob else []
+    
+    def transforms(self, i):
+        """Return snapshot i's (n, SNAPSHOT_WIDTH) transforms as a view into the mapped file."""
+        entry = self.index[i]
+        count = int(entry["count"])
+        return np.frombuffer(
+            self._map, dtype = "<f4", count = count * SNAPSHOT_WIDTH, offset = int(entry["data_offset"])).reshape(count, SNAPSHOT_WIDTH)
+    
+    def snapshots(self):
+        """Yield (name, object names, transforms view) for every snapshot in the library."""
+        for i, name in enumerate(self.names()):
+            yield name, self.object_names(i), self.transforms(i)
+
+def write_snapshot_library(path, snapshots):
+    """Stream (name, object names, (n, SNAPSHOT_WIDTH) transforms) snapshots into a binary library at path and return how many were written.
+
+    Raises ValueError for a name longer than LIBRARY_NAME_BYTES, which the fixed-size index cannot hold.
+    """
+    index = []
+    with open(path, "wb") as f:
+        f.write(LIBRARY_HEADER.pack(LIBRARY_MAGIC, LIBRARY_VERSION, 0, 0))
+        for name, object_names, transforms in snapshots:
+            encoded = name.encode("utf-8")
+            if len(encoded) > LIBRARY_NAME_BYTES:
+                raise ValueError(f"Snapshot name '{name}' is longer than {LIBRARY_NAME_BYTES} bytes")
+            blob = NAME_SEPARATOR.join(object_names).encode("utf-8")
+            names_offset = f.tell()
+            f.write(blob)
+            #Keep every float array 8-byte aligned
+            f.write(b"\0" * (-f.tell() % 8))
+            data_offset = f.tell()
+            f.write(np.ascontiguousarray(transforms, dtype = "<f4").tobytes())
+            index.append((encoded, len(transforms), names_offset, len(blob), data_offset))
+        f.write(b"\0" * (-f.tell() % 8))
+        index_offset = f.tell()
+        f.write(np.array(index, dtype = LIBRARY_INDEX_DTYPE).tobytes())
+        f.seek(0)
+        f.write(LIBRARY_HEADER.pack(LIBRARY_MAGIC, LIBRARY_VERSION, len(index), index_offset))
+    return len(index)
+
+#Open libraries per absolute path: (modification time, SnapshotLibrary)
+_libraries = {}
+
+def open_snapshot_library(path):
+    """Return the memory-mapped library at path, reopening it only when the file has changed."""
+    mtime = os.path.getmtime(path)
+    cached = _libraries.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, SnapshotLibrary(path))
+        _libraries[path] = cached
+    return cached[1]
+
+def export_snapshots_to_library(scene, path):
+    """Write every scene snapshot into the library at path, keeping library snapshots with other names, and return the total written."""
+    store = get_snapshot_store(scene)
+    scene_snapshots = [
+        (name, entry["names"].split(NAME_SEPARATOR), np.array(entry["transforms"], dtype = np.float32).reshape(-1, SNAPSHOT_WIDTH))
+        for name, entry in (store.items() if store is not None else [])
+    ]
+    replaced = {name for name, _names, _transforms in scene_snapshots}
+    kept = []
+    if os.path.exists(path):
+        kept = (snapshot for snapshot in open_snapshot_library(path).snapshots() if snapshot[0] not in replaced)
+    temporary = path + ".tmp"
+    try:
+        count = write_snapshot_library(temporary, itertools.chain(kept, scene_snapshots))
+    except (OSError, ValueError):
+        #The existing library stays untouched
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    #Drop the mapping of the old file before replacing it
+    kept = None
+    _libraries.pop(path, None)
+    os.replace(temporary, path)
+    return count
+
+def import_library_snapshot(scene, library, name):
+    """Copy snapshot name from library into the scene's snapshot store and return its object count."""
+    i = library.find(name)
+    transforms = library.transforms(i)
+    get_snapshot_store(scene, create = True)[name] = {
+        "names": NAME_SEPARATOR.join(library.object_names(i)),
+        "transforms": transforms.ravel().tolist(),
+    }
+    return len(transforms)
+
+#Keeps the dynamic enum strings referenced while Blender shows them
+_snapshot_items = []
+_library_items = []
+
+def snapshot_items(self, context):
+    store = get_snapshot_store(context.scene)
+    _snapshot_items[:] = [(name, name, f"Snapshot '{name}'") for name in (store.keys() if store is not None else [])]
+    return _snapshot_items
+
+def library_snapshot_items(self, context):
+    path = bpy.path.abspath(context.scene.snapshot_library)
+    try:
+        names = open_snapshot_library(path).names() if path else []
+    except (OSError, ValueError):
+        names = []
+    _library_items[:] = [(name, name, f"Library snapshot '{name}'") for name in names]
+    return _library_items
+
+def get_active_library(context):
+    """Return the library at the scene's Snapshot Library path, raising OSError or ValueError when it cannot be opened."""
+    path = bpy.path.abspath(context.scene.snapshot_library)
+    if not path:
+        raise ValueError("Set a snapshot library file")
+    return open_snapshot_library(path)
+
+@timed_operator
+class ExportSnapshotLibraryOperator(bpy.types.Operator):
+    bl_idname = "object.export_snapshot_library"
+    bl_label = "Export to Library"
+    bl_options = {'REGISTER'}
+    
+    def execute(self, context):
+        path = bpy.path.abspath(context.scene.snapshot_library)
+        if not path:
+            self.report({'ERROR'}, "Set a snapshot library file")
+            return {'CANCELLED'}
+        try:
+            count = export_snapshots_to_library(context.scene, path)
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Could not write {path}: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Library {os.path.basename(path)} now holds {count} snapshots")
+        return {'FINISHED'}
+
+@timed_operator
+class ApplyLibrarySnapshotOperator(bpy.types.Operator):
+    bl_idname = "object.apply_library_snapshot"
+    bl_label = "Apply from Library"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        scene = context.scene
+        try:
+            library = get_active_library(context)
+            i = library.find(scene.library_snapshot)
+        except (OSError, ValueError, KeyError) as e:
+            self.report({'ERROR'}, f"Cannot read library snapshot: {e}")
+            return {'CANCELLED'}
+        
+        only = {obj.name for obj in context.selected_objects} if scene.library_selected_only else None
+        restored, missing = apply_transforms(library.object_names(i), library.transforms(i), only)
+        context.view_layer.update()
+        if missing:
+            self.report({'WARNING'}, f"Applied {restored} objects from '{scene.library_snapshot}', {missing} not found")
+        else:
+            self.report({'INFO'}, f"Applied {restored} objects from '{scene.library_snapshot}'")
+        return {'FINISHED'}
+
+@timed_operator
+class ImportLibrarySnapshotOperator(bpy.types.Operator):
+    bl_idname = "object.import_library_snapshot"
+    bl_label = "Import to Scene"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        scene = context.scene
+        try:
+            count = import_library_snapshot(scene, get_active_library(context), scene.library_snapshot)
+        except (OSError, ValueError, KeyError) as e:
+            self.report({'ERROR'}, f"Cannot read library snapshot: {e}")
+            return {'CANCELLED'}
+        scene.active_snapshot = scene.library_snapshot
+        self.report({'INFO'}, f"Imported '{scene.library_snapshot}' with {count} objects")
+        return {'FINISHED'}
+
+@timed_operator
+class SaveSnapshotOperator(bpy.types.Operator):
+    bl_idname = "object.save_transform_snapshot"
+    bl_label = "Save Snapshot"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        name = context.scene.snapshot_name.strip()
+        if not name:
+            self.report({'ERROR'}, "Enter a snapshot name")
+            return {'CANCELLED'}
+        objects = context.selected_objects
+        if not objects:
+            self.report({'ERROR'}, "No objects selected")
+            return {'CANCELLED'}
+        
+        count = save_snapshot(context.scene, name, objects)
+        context.scene.active_snapshot = name
+        self.report({'INFO'}, f"Saved {count} objects to snapshot '{name}'")
+        logger.debug("Saved snapshot %s with %d objects", name, count)
+        return {'FINISHED'}
+
+@timed_operator
+class RecallSnapshotOperator(bpy.types.Operator):
+    bl_idname = "object.recall_transform_snapshot"
+    bl_label = "Recall Snapshot"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        name = context.scene.active_snapshot
+        if not name:
+            self.report({'ERROR'}, "No snapshot to recall")
+            return {'CANCELLED'}
+        
+        restored, missing = recall_snapshot(context.scene, name)
+        context.view_layer.update()
+        if missing:
+            self.report({'WARNING'}, f"Recalled {restored} objects from '{name}', {missing} no longer exist")
+        else:
+            self.report({'INFO'}, f"Recalled {restored} objects from '{name}'")
+        return {'FINISHED'}
+
+@timed_operator
+class DeleteSnapshotOperator(bpy.types.Operator):
+    bl_idname = "object.delete_transform_snapshot"
+    bl_label = "Delete Snapshot"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        name = context.scene.active_snapshot
+        if not name:
+            self.report({'ERROR'}, "No snapshot to delete")
+            return {'CANCELLED'}
+        
+        delete_snapshot(context.scene, name)
+        self.report({'INFO'}, f"Deleted snapshot '{name}'")
+        return {'FINISHED'}
+
+@timed_operator
+class AddSlotGroupOperator(bpy.types.Operator):
+    bl_idname = "object.add_slot_group"
+    bl_label = "Add Slot Group"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        scene = context.scene
+        group = scene.slot_groups.add()
+        group.name = f"Group {len(scene.slot_groups)}"
+        scene.active_slot_group = len(scene.slot_groups) - 1
+        return {'FINISHED'}
+
+@timed_operator
+class RemoveSlotGroupOperator(bpy.types.Operator):
+    bl_idname = "object.remove_slot_group"
+    bl_label = "Remove Slot Group"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        scene = context.scene
+        if not 0 <= scene.active_slot_group < len(scene.slot_groups):
+            self.report({'ERROR'}, "No slot group selected")
+            return {'CANCELLED'}
+        scene.slot_groups.remove(scene.active_slot_group)
+        scene.active_slot_group = max(0, scene.active_slot_group - 1)
+        return {'FINISHED'}
+
+@timed_operator
+class AddSlotVariantsOperator(bpy.types.Operator):
+    bl_idname = "object.add_slot_variants"
+    bl_label = "Add Selected as Variants"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        scene = context.scene
+        if not 0 <= scene.active_slot_group < len(scene.slot_groups):
+            self.report({'ERROR'}, "No slot group selected")
+            return {'CANCELLED'}
+        group = scene.slot_groups[scene.active_slot_group]
+        existing = {slot.object for slot in group.slots}
+        added = [obj for obj in context.selected_objects if obj not in existing]
+        if not added:
+            self.report({'ERROR'}, "No new objects selected")
+            return {'CANCELLED'}
+        
+        for obj in added:
+            group.slots.add().object = obj
+        #The first variant of a new group is shown; every other new variant starts hidden
+        if group.shown_index < 0:
+            switch_slot_group(group, min(group.active_index, len(group.slots) - 1))
+        for obj in added:
+            if obj != group.slots[group.shown_index].object:
+                set_slot_visibility(obj, False)
+        self.report({'INFO'}, f"Added {len(added)} variants to {group.name}")
+        return {'FINISHED'}
+
+@timed_operator
+class RemoveSlotVariantOperator(bpy.types.Operator):
+    bl_idname = "object.remove_slot_variant"
+    bl_label = "Remove Variant"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        scene = context.scene
+        if not 0 <= scene.active_slot_group < len(scene.slot_groups):
+            self.report({'ERROR'}, "No slot group selected")
+            return {'CANCELLED'}
+        group = scene.slot_groups[scene.active_slot_group]
+        index = group.active_index
+        if not 0 <= index < len(group.slots):
+            self.report({'ERROR'}, "No variant selected")
+            return {'CANCELLED'}
+        
+        obj = group.slots[index].object
+        if obj:
+            set_slot_visibility(obj, True)
+        group.slots.remove(index)
+        #Keep shown_index pointing at the same object; the removed variant is left visible and no longer tracked
+        if group.shown_index == index:
+            group.shown_index = -1
+        elif group.shown_index > index:
+            group.shown_index -= 1
+        return {'FINISHED'}
+
+@timed_operator
+class SwitchAllSlotGroupsOperator(bpy.types.Operator):
+    bl_idname = "object.switch_all_slot_groups"
+    bl_label = "Switch All Groups"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    variant: bpy.props.IntProperty(name = "Variant", default = 0, min = 0)
+    
+    def execute(self, context):
+        switched = switch_all_slot_groups(context.scene.slot_groups, self.variant)
+        context.view_layer.update()
+        self.report({'INFO'}, f"Switched {switched} groups to variant {self.variant + 1}")
+        return {'FINISHED'}
+
+class SAVING_UL_slot_groups(bpy.types.UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        layout.prop(item, "name", text = "", emboss = False, icon = 'GROUP')
+        layout.label(text = f"{len(item.slots)} variants")
+
+class SAVING_UL_slot_variants(bpy.types.UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        shown = index == data.shown_index
+        layout.prop(item, "object", text = "", emboss = False, icon = 'HIDE_OFF' if shown else 'HIDE_ON')
+
+@timed_operator
+class NudgeModalOperator(bpy.types.Operator):
+    bl_idname = "object.nudge_modal"
+    bl_label = "Nudge"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    _timer = None
+    _obj = None
+    _start = None
+    _pending = 0
+    _pushed = 0
+    _axis = 0
+    
+    def invoke(self, context, event):
+        obj = context.scene.move_object
+        if not obj:
+            self.report({'ERROR'}, "No object selected")
+            return {'CANCELLED'}
+        
+        self._obj = obj
+        self._start = obj.location.copy()
+        self._pending = 0
+        self._pushed = 0
+        self._axis = "XYZ".index(context.scene.nudge_axis)
+        wm = context.window_manager
+        #Key repeats only accumulate; the timer applies them at most once per redraw
+        self._timer = wm.event_timer_add(1.0 / 60.0, window = context.window)
+        wm.modal_handler_add(self)
+        self._update_header(context)
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        if event.type == 'TIMER':
+            self._flush(context)
+            return {'RUNNING_MODAL'}
+        if event.value != 'PRESS':
+            return {'RUNNING_MODAL'} if event.type in NUDGE_FORWARD_KEYS | NUDGE_BACKWARD_KEYS else {'PASS_THROUGH'}
+        
+        if event.type in NUDGE_FORWARD_KEYS:
+            self._pending += 10 if event.shift else 1
+        elif event.type in NUDGE_BACKWARD_KEYS:
+            self._pending -= 10 if event.shift else 1
+        elif event.type in {'X', 'Y', 'Z'}:
+            self._flush(context)
+            self._axis = "XYZ".index(event.type)
+            context.scene.nudge_axis = event.type
+            self._update_header(context)
+        elif event.type in {'RET', 'NUMPAD_ENTER', 'SPACE', 'LEFTMOUSE'}:
+            self._flush(context)
+            return self._finish(context, {'FINISHED'})
+        elif event.type in {'ESC', 'RIGHTMOUSE'}:
+            self._obj.location = self._start
+            #A cancelled session leaves no nudges behind to step back
+            for _ in range(min(self._pushed, len(_nudge_history))):
+                _nudge_history.pop()
+            return self._finish(context, {'CANCELLED'})
+        else:
+            return {'PASS_THROUGH'}
+        return {'RUNNING_MODAL'}
+    
+    def _flush(self, context):
+        #Apply every step gathered since the last redraw as one move and one history entry
+        if not self._pending:
+            return
+        distance = self._pending * context.scene.nudge_step
+        self._obj.location[self._axis] += distance
+        _nudge_history.append((self._obj.name, self._axis, distance))
+        self._pushed += 1
+        self._pending = 0
+        self._update_header(context)
+    
+    def _update_header(self, context):
+        if context.area:
+            offset = self._obj.location[self._axis] - self._start[self._axis]
+            context.area.header_text_set(f"Nudge {'XYZ'[self._axis]}: {offset:+.4f}  (arrows/wheel, Shift x10, X/Y/Z axis, Enter confirm, Esc cancel)")
+    
+    def _finish(self, context, result):
+        context.window_manager.event_timer_remove(self._timer)
+        if context.area:
+            context.area.header_text_set(None)
+        if 'FINISHED' in result:
+            self.report({'INFO'}, f"Nudged {self._obj.name} to {tuple(round(v, 4) for v in self._obj.location)}")
+        return result
+
+@timed_operator
+class NudgeStepBackOperator(bpy.types.Operator):
+    bl_idname = "object.nudge_step_back"
+    bl_label = "Step Back"
+    bl_options = {'REGISTER'}
+    
+    def execute(self, context):
+        while _nudge_history:
+            name, axis, distance = _nudge_history.pop()
+            obj = bpy.data.objects.get(name)
+            if obj:
+                obj.location[axis] -= distance
+                self.report({'INFO'}, f"Stepped {obj.name} back {distance:+.4f} along {'XYZ'[axis]}")
+                return {'FINISHED'}
+        self.report({'ERROR'}, "No nudges to step back")
+        return {'CANCELLED'}
+
+@timed_operator
 class MoveObjectXOperator(bpy.types.Operator):
     bl_idname = "object.move_x_offset"
     bl_label = "Move X by 0.01"
@@ -54,7 +682,7 @@ class MoveObjectXOperator(bpy.types.Operator):
         obj = context.scene.move_object
         if not obj:
             self.report({'ERROR'}, "No object selected")
-            print("ERROR: No object selected for movement")
+            logger.error("No object selected for movement")
             return{'CANCELLED'}
         
         obj.location.x += 0.01
@@ -62,6 +690,7 @@ class MoveObjectXOperator(bpy.types.Operator):
         context.view_layer.update()
         return {'FINISHED'}
 
+@timed_operator
 class ResetObjectLocationOperator(bpy.types.Operator):
     bl_idname = "object.reset_location"
     bl_label = "Reset Location & Rotation"
@@ -79,6 +708,7 @@ class ResetObjectLocationOperator(bpy.types.Operator):
         context.view_layer.update()
         return {'FINISHED'}    
     
+@timed_operator
 class SaveObjectLocationOperator(bpy.types.Operator):
     bl_idname = "object.save_location_rotation"
     bl_label = "Save Location & Rotation"
@@ -88,7 +718,7 @@ class SaveObjectLocationOperator(bpy.types.Operator):
         obj = context.scene.move_object
         if not obj:
             self.report({'ERROR'}, "No object selected")
-            print("ERROR: No object selected")
+            logger.error("No object selected")
             return {'CANCELLED'}
         
         saved_data = context.scene.object_location
@@ -100,6 +730,7 @@ class SaveObjectLocationOperator(bpy.types.Operator):
         self.report({'INFO'}, f"Saved {obj.name} location and rotation")
         return {'FINISHED'}
     
+@timed_operator
 class RecallObjectLocationOperator(bpy.types.Operator):
     bl_idname = "object.recall_saved_location_rotation"
     bl_label = "Recall Saved Location & Rotation"
@@ -123,6 +754,7 @@ class RecallObjectLocationOperator(bpy.types.Operator):
         context.view_layer.update()
         return {'FINISHED'}
     
+@timed_operator
 class ClearSavedLocationOperator(bpy.types.Operator):
     bl_idname = "object.clear_saved_location"
     bl_label = "Clear Saves"
@@ -136,9 +768,10 @@ class ClearSavedLocationOperator(bpy.types.Operator):
         obj_location.has_saved_rotation = False
         
         self.report({'INFO'}, "Cleared Save")
-        print("DEBUG: Cleared save")
+        logger.debug("Cleared save")
         return {'FINISHED'}
     
+@timed_operator
 class RotateObjectOperator(bpy.types.Operator):
     bl_idname = "object.rotate_45_z"
     bl_label = "Rotate 45"
@@ -189,6 +822,25 @@ class MoveObjectPanel(bpy.types.Panel):
         else:
             box.label(text = "No Object in active slot", icon = 'ERROR')
         
+        #Slot groups
+        box = layout.box()
+        box.label(text = "Slot Groups", icon = 'GROUP')
+        row = box.row()
+        row.template_list("SAVING_UL_slot_groups", "", scene, "slot_groups", scene, "active_slot_group", rows = 3)
+        col = row.column(align = True)
+        col.operator("object.add_slot_group", icon = 'ADD', text = "")
+        col.operator("object.remove_slot_group", icon = 'REMOVE', text = "")
+        if 0 <= scene.active_slot_group < len(scene.slot_groups):
+            group = scene.slot_groups[scene.active_slot_group]
+            row = box.row()
+            row.template_list("SAVING_UL_slot_variants", "", group, "slots", group, "active_index", rows = 4)
+            col = row.column(align = True)
+            col.operator("object.add_slot_variants", icon = 'ADD', text = "")
+            col.operator("object.remove_slot_variant", icon = 'REMOVE', text = "")
+        row = box.row(align = True)
+        row.prop(scene, "slot_variant", text = "Variant")
+        row.operator("object.switch_all_slot_groups").variant = scene.slot_variant - 1
+        
         #Saved Status
         box = layout.box()
         saved_data = scene.object_location
@@ -206,15 +858,61 @@ class MoveObjectPanel(bpy.types.Panel):
         box.operator("object.reset_location")
         box.operator("object.clear_saved_location")
         box.operator("object.rotate_45_z")
+        row = box.row(align = True)
+        row.prop(scene, "nudge_step")
+        row.prop(scene, "nudge_axis", expand = True)
+        row = box.row(align = True)
+        row.operator("object.nudge_modal")
+        row.operator("object.nudge_step_back", text = f"Step Back ({len(_nudge_history)})")
+        
+        #Snapshots
+        box = layout.box()
+        box.label(text = "Snapshots", icon = 'FILE_BLEND')
+        row = box.row(align = True)
+        row.prop(scene, "snapshot_name", text = "")
+        row.operator("object.save_transform_snapshot", text = "Save Selected")
+        row = box.row(align = True)
+        row.prop(scene, "active_snapshot", text = "")
+        row.operator("object.recall_transform_snapshot", text = "Recall")
+        row.operator("object.delete_transform_snapshot", text = "", icon = 'X')
+        
+        #Snapshot library
+        box = layout.box()
+        box.label(text = "Snapshot Library", icon = 'ASSET_MANAGER')
+        box.prop(scene, "snapshot_library", text = "")
+        box.operator("object.export_snapshot_library")
+        row = box.row(align = True)
+        row.prop(scene, "library_snapshot", text = "")
+        row.prop(scene, "library_selected_only", text = "", icon = 'RESTRICT_SELECT_OFF')
+        row = box.row(align = True)
+        row.operator("object.apply_library_snapshot", text = "Apply")
+        row.operator("object.import_library_snapshot", text = "Import")
                  
 classes = [
     ObjectLocationPropertyGroup,
+    SlotItem,
+    SlotGroup,
+    AddSlotGroupOperator,
+    RemoveSlotGroupOperator,
+    AddSlotVariantsOperator,
+    RemoveSlotVariantOperator,
+    SwitchAllSlotGroupsOperator,
+    SAVING_UL_slot_groups,
+    SAVING_UL_slot_variants,
     MoveObjectXOperator, 
     ResetObjectLocationOperator,
     SaveObjectLocationOperator,
     RecallObjectLocationOperator,
     ClearSavedLocationOperator,
     RotateObjectOperator,
+    SaveSnapshotOperator,
+    RecallSnapshotOperator,
+    DeleteSnapshotOperator,
+    ExportSnapshotLibraryOperator,
+    ApplyLibrarySnapshotOperator,
+    ImportLibrarySnapshotOperator,
+    NudgeModalOperator,
+    NudgeStepBackOperator,
     MoveObjectPanel,
 ]
 
@@ -233,6 +931,41 @@ def register():
     )
     bpy.types.Scene.object_location = bpy.props.PointerProperty(type = ObjectLocationPropertyGroup)
     bpy.types.Scene.move_object = bpy.props.PointerProperty(type = bpy.types.Object)
+    bpy.types.Scene.slot_groups = bpy.props.CollectionProperty(type = SlotGroup)
+    bpy.types.Scene.active_slot_group = bpy.props.IntProperty(name = "Active Slot Group", default = 0)
+    bpy.types.Scene.slot_variant = bpy.props.IntProperty(
+        name = "Variant",
+        description = "Variant number every slot group switches to",
+        default = 1,
+        min = 1
+    )
+    bpy.types.Scene.nudge_step = bpy.props.FloatProperty(
+        name = "Step",
+        description = "Distance moved per nudge key press",
+        default = 0.01,
+        min = 0.0,
+        precision = 4
+    )
+    bpy.types.Scene.nudge_axis = bpy.props.EnumProperty(
+        name = "Nudge Axis",
+        items = [('X', "X", "Nudge along X"), ('Y', "Y", "Nudge along Y"), ('Z', "Z", "Nudge along Z")],
+        default = 'X'
+    )
+    bpy.types.Scene.snapshot_name = bpy.props.StringProperty(name = "Snapshot Name", default = "Layout A")
+    bpy.types.Scene.active_snapshot = bpy.props.EnumProperty(
+        name = "Snapshot",
+        items = snapshot_items
+    )
+    bpy.types.Scene.snapshot_library = bpy.props.StringProperty(name = "Snapshot Library", subtype = 'FILE_PATH', default = "//snapshots.tsnap")
+    bpy.types.Scene.library_snapshot = bpy.props.EnumProperty(
+        name = "Library Snapshot",
+        items = library_snapshot_items
+    )
+    bpy.types.Scene.library_selected_only = bpy.props.BoolProperty(
+        name = "Selected Only",
+        description = "Apply library snapshots only to the selected objects",
+        default = False
+    )
     
         
     
@@ -245,6 +978,17 @@ def unregister():
     del bpy.types.Scene.active_object_slot
     del bpy.types.Scene.object_location  
     del bpy.types.Scene.move_object  
+    del bpy.types.Scene.nudge_step
+    del bpy.types.Scene.nudge_axis
+    del bpy.types.Scene.slot_groups
+    del bpy.types.Scene.active_slot_group
+    del bpy.types.Scene.slot_variant
+    del bpy.types.Scene.snapshot_name
+    del bpy.types.Scene.active_snapshot
+    del bpy.types.Scene.snapshot_library
+    del bpy.types.Scene.library_snapshot
+    del bpy.types.Scene.library_selected_only
+    _libraries.clear()
 
 if __name__ == "__main__":
     register()
@@ -0,0 +1,180 @@
+"""Benchmarks for the bpy-free distance_core module, run with plain Python outside Blender.
+
+    python benchmarks/bench_distance_core.py --output bench.json --baseline previous.json
+
+Objects are lightweight stand-ins exposing the same bound_box / matrix_world / foreach_get surface that
+distance_core reads from real Blender objects.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import distance_core
+
+DEFAULT_SIZES = (10, 1_000, 100_000, 1_000_000)
+# Pairs measured one at a time by the single-pair case, whatever the scene size
+SINGLE_PAIR_QUERIES = 1_000
+# A case counts as a regression when it is this much slower than the baseline
+REGRESSION_RATIO = 1.2
+
+
+class FakeObject:
+    """Stand-in for a mesh bpy.types.Object, viewing one row of a FakeObjectCollection."""
+
+    type = 'MESH'
+
+    def __init__(self, collection, index):
+        self.collection = collection
+        self.index = index
+        self.name = f"Object.{index:07d}"
+
+    @property
+    def bound_box(self):
+        return self.collection.corners[self.index].tolist()
+
+    @property
+    def matrix_world(self):
+        # Row-major, like a mathutils.Matrix iterated by rows
+        return self.collection.matrices[self.index].reshape(4, 4).T.tolist()
+
+    def as_pointer(self):
+        return id(self.collection) + self.index
+
+
+class FakeObjectCollection:
+    """Stand-in for a bpy_prop_collection of objects, backed by arrays so a million objects stay cheap."""
+
+    def __init__(self, corners, matrices):
+        self.corners = corners      # (n, 8, 3) float32 local bound boxes
+        self.matrices = matrices    # (n, 16) float32, column-major like Blender's raw storage
+
+    def __len__(self):
+        return len(self.corners)
+
+    def __getitem__(self, index):
+        return FakeObject(self, index)
+
+    def foreach_get(self, attr, buffer):
+        source = {"bound_box": self.corners, "matrix_world": self.matrices}[attr]
+        buffer[:] = source.ravel()
+
+
+def make_scene(count, seed=0):
+    """Return a FakeObjectCollection of count boxes laid out in rows along X with random sizes and spacing."""
+    rng = np.random.default_rng(seed)
+    half = rng.uniform(0.2, 1.0, size=(count, 3)).astype(np.float32)
+    signs = np.array([[x, y, z] for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)], dtype=np.float32)
+    corners = half[:, None, :] * signs[None, :, :]
+    row_length = max(int(np.sqrt(count)), 1)
+    matrices = np.zeros((count, 4, 4), dtype=np.float32)
+    matrices[:, [0, 1, 2, 3], [0, 1, 2, 3]] = 1.0
+    # Column-major storage puts the translation in the last row
+    matrices[:, 3, 0] = (np.arange(count) % row_length) * 2.5 + rng.uniform(-0.5, 0.5, count)
+    matrices[:, 3, 1] = (np.arange(count) // row_length) * 2.5
+    return FakeObjectCollection(corners, matrices.reshape(count, 16))
+
+
+def _time(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_single_pair(scene, repeat):
+    """Measure SINGLE_PAIR_QUERIES neighbouring pairs one call at a time, as DistanceOperator does."""
+    count = len(scene)
+    pairs = [(scene[i % count], scene[(i + 1) % count]) for i in range(SINGLE_PAIR_QUERIES)]
+
+    def run():
+        for obj1, obj2 in pairs:
+            mins, maxs = distance_core.get_world_bounds([obj1, obj2])
+            distance_core.gaps_from_bounds(mins[0], maxs[0], mins[1], maxs[1])
+
+    return _time(run, repeat) / len(pairs)
+
+
+def bench_batch(scene, repeat):
+    """Read every object in bulk and compute all neighbouring X gaps."""
+    def run():
+        mins, maxs = distance_core.get_world_bounds(scene)
+        distance_core.neighbour_x_gaps(mins, maxs)
+
+    return _time(run, repeat)
+
+
+def bench_scene(scene, repeat):
+    """Sweep-and-prune every overlapping or too-close pair in the scene."""
+    mins, maxs = distance_core.get_world_bounds(scene)
+
+    def run():
+        for _pair in distance_core.iter_clearance_pairs(mins, maxs, 0.1):
+            pass
+
+    return _time(run, repeat)
+
+
+CASES = {
+    "single_pair": bench_single_pair,
+    "batch": bench_batch,
+    "scene": bench_scene,
+}
+
+
+def run(sizes, repeat):
+    results = {}
+    for count in sizes:
+        scene = make_scene(count)
+        for name, case in CASES.items():
+            key = f"{name}/{count}"
+            results[key] = case(scene, repeat)
+            print(f"{key:>22}: {results[key] * 1e3:10.3f} ms")
+    return results
+
+
+def compare(results, baseline):
+    """Return the cases that got slower than REGRESSION_RATIO times their baseline timing."""
+    regressions = []
+    for key, seconds in results.items():
+        previous = baseline.get(key)
+        if previous and seconds > previous * REGRESSION_RATIO:
+            regressions.append((key, previous, seconds))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="scene sizes in objects")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case; the best time is kept")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare against results from an earlier --output")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.repeat)
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump({
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "machine": platform.machine(),
+                "results": results,
+            }, handle, indent=2, sort_keys=True)
+    if args.baseline:
+        with open(args.baseline) as handle:
+            regressions = compare(results, json.load(handle)["results"])
+        for key, previous, seconds in regressions:
+            print(f"REGRESSION {key}: {previous * 1e3:.3f} ms -> {seconds * 1e3:.3f} ms")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,440 @@
+import csv
+import io
+import json
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context, shared_memory
+
+# Vertices per task, and per progress/cancellation step when running in-process
+CHUNK_SIZE = 1 << 18
+# Arrays with fewer rows stay in-process; below this the pool start-up and shared-memory copy cost more than they save
+PARALLEL_THRESHOLD = 2_000_000
+
+# Lazily started process pool shared by every parallel kernel
+_pool = {"executor": None}
+
+# Object adapter: everything below reads objects only through bound_box, matrix_world and, for bpy collections,
+# foreach_get, so real Blender objects and lightweight stand-ins go through the same code path.
+
+def read_object_arrays(objects):
+    """Read local bound boxes (n, 8, 3) and row-major world matrices (n, 4, 4) for objects in bulk."""
+    n = len(objects)
+    if hasattr(objects, "foreach_get"):
+        # bpy_prop_collection: one C-level copy per property instead of n Python round-trips
+        corners = np.empty(n * 24, dtype=np.float32)
+        matrices = np.empty(n * 16, dtype=np.float32)
+        objects.foreach_get("bound_box", corners)
+        objects.foreach_get("matrix_world", matrices)
+        # matrix_world is stored column-major
+        return corners.reshape(n, 8, 3).astype(np.float64), matrices.reshape(n, 4, 4).transpose(0, 2, 1).astype(np.float64)
+    corners = np.array([obj.bound_box for obj in objects], dtype=np.float64).reshape(n, 8, 3)
+    matrices = np.array([obj.matrix_world for obj in objects], dtype=np.float64).reshape(n, 4, 4)
+    return corners, matrices
+
+def get_world_bounds(objects):
+    """Return world-space AABB (mins, maxs) arrays of shape (n, 3), transforming every bound box corner in one array operation."""
+    if len(objects) == 0:
+        return np.empty((0, 3)), np.empty((0, 3))
+    return transform_bounds(*read_object_arrays(objects))
+
+# Measurement and placement math on plain arrays
+
+def transform_bounds(corners, matrices):
+    """Return world-space (mins, maxs) of shape (n, 3) for local corners (n, k, 3) under row-major matrices (n, 4, 4)."""
+    world = np.einsum('nij,nkj->nki', matrices[:, :3, :3], corners) + matrices[:, None, :3, 3]
+    return world.min(axis=1), world.max(axis=1)
+
+def transform_points_bounds(points, matrix):
+    """Return world-space (mins, maxs) of local points (k, 3) under one row-major matrix (4, 4)."""
+    world = points @ matrix[:3, :3].T + matrix[:3, 3]
+    return world.min(axis=0), world.max(axis=0)
+
+def shared_points_bounds(points, matrices):
+    """Return world-space AABB (mins, maxs) arrays of shape (k, 3) for one local point set placed by k row-major world matrices."""
+    count = len(matrices)
+    mins = np.empty((count, 3))
+    maxs = np.empty((count, 3))
+    # Bound the (instances, points, 3) intermediate to about CHUNK_SIZE points
+    step = max(1, CHUNK_SIZE // max(len(points), 1))
+    for start in range(0, count, step):
+        chunk = matrices[start:start + step]
+        world = np.einsum('pj,kij->kpi', points, chunk[:, :3, :3]) + chunk[:, None, :3, 3]
+        mins[start:start + step] = world.min(axis=1)
+        maxs[start:start + step] = world.max(axis=1)
+    return mins, maxs
+
+def gaps_from_bounds(mins1, maxs1, mins2, maxs2):
+    """Return signed per-axis gaps from box 1 to box 2 (obj2 on the positive side) and the Euclidean separation of the boxes."""
+    gaps = mins2 - maxs1
+    apart = np.maximum(gaps, mins1 - maxs2)
+    separation = np.sqrt(np.square(np.maximum(apart, 0.0)).sum(axis=-1))
+    return gaps, separation
+
+def neighbour_x_gaps(mins, maxs):
+    """Sort boxes by their left side and return (order, gaps), where gaps[i] is the X-distance from box order[i] to box order[i + 1]."""
+    order = np.argsort(mins[:, 0], kind='stable')
+    gaps = mins[order[1:], 0] - maxs[order[:-1], 0]
+    return order, gaps
+
+def x_distance_matrix(mins, maxs):
+    """Return an (n, n) matrix whose [i, j] entry is the X-distance from the right side of box i to the left side of box j."""
+    return mins[None, :, 0] - maxs[:, None, 0]
+
+def compute_distribution_shifts(mins_x, maxs_x, gap):
+    """Return per-object X shifts that pack objects left to right in their current order, gap apart, starting from the leftmost."""
+    order = np.argsort(mins_x, kind='stable')
+    widths = maxs_x[order] - mins_x[order]
+    # Prefix sum of widths plus gaps gives every new left side in one pass
+    starts = mins_x[order[0]] + np.concatenate(([0.0], np.cumsum(widths[:-1] + gap)))
+    shifts = np.empty(len(mins_x))
+    shifts[order] = starts - mins_x[order]
+    return shifts
+
+def _sweep_pairs(mins, maxs, members, clearance, groups=None):
+    """Yield (i, j, separation) for close boxes among members (indices sorted by left side).
+
+    With groups, only pairs whose members belong to different groups are yielded.
+    """
+    ends = np.searchsorted(mins[members, 0], maxs[members, 0] + clearance, side='right')
+    active = np.flatnonzero(ends > np.arange(len(members)) + 1)
+    offset = 1
+    while len(active):
+        other = active + offset
+        first = members[active]
+        second = members[other]
+        # Per-axis gaps between each active box and its candidate, positive when apart
+        gaps = np.maximum(mins[second] - maxs[first], mins[first] - maxs[second])
+        overlapping = np.all(gaps <= 0.0, axis=1)
+        separation = np.where(overlapping, gaps.max(axis=1), np.sqrt(np.square(np.maximum(gaps, 0.0)).sum(axis=1)))
+        close = (separation < clearance) | (overlapping if clearance <= 0.0 else False)
+        if groups is not None:
+            close &= groups[active] != groups[other]
+        for a, b, value in zip(first[close], second[close], separation[close]):
+            yield int(a), int(b), float(value)
+        offset += 1
+        active = active[ends[active] > active + offset]
+
+def iter_clearance_pairs(mins, maxs, clearance=0.0):
+    """Yield (i, j, separation) for every pair of boxes that overlap or sit closer than clearance.
+
+    Sweep-and-prune along X inside horizontal Y slabs: each slab is at least as tall as the tallest box plus
+    clearance, so a box can only meet boxes in its own slab or the next one, and 2D layouts do not degrade into
+    one long sweep. Within a sweep every box is only tested against the boxes starting before its right side plus
+    clearance, one offset at a time across all boxes at once. separation is the Euclidean gap between the boxes,
+    or minus the smallest overlap depth when they intersect.
+    """
+    if len(mins) < 2:
+        return
+    height = float((maxs[:, 1] - mins[:, 1]).max()) + clearance
+    if height > 0.0:
+        slabs = np.floor((mins[:, 1] - mins[:, 1].min()) / height).astype(np.int64)
+    else:
+        slabs = np.zeros(len(mins), dtype=np.int64)
+    order = np.lexsort((mins[:, 0], slabs))
+    slab_ids, starts = np.unique(slabs[order], return_index=True)
+    stops = np.append(starts[1:], len(order))
+    for k, slab in enumerate(slab_ids):
+        members = order[starts[k]:stops[k]]
+        yield from _sweep_pairs(mins, maxs, members, clearance)
+        if k + 1 < len(slab_ids) and slab_ids[k + 1] == slab + 1:
+            upper = order[starts[k + 1]:stops[k + 1]]
+            merged = np.concatenate((members, upper))
+            groups = np.concatenate((np.zeros(len(members), dtype=bool), np.ones(len(upper), dtype=bool)))
+            by_left = np.argsort(mins[merged, 0], kind='stable')
+            yield from _sweep_pairs(mins, maxs, merged[by_left], clearance, groups[by_left])
+
+def triangle_edges(triangles):
+    """Return the unique undirected edges (e, 2) of triangles (t, 3)."""
+    edges = np.concatenate((triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]))
+    return np.unique(np.sort(edges, axis=1), axis=0)
+
+def segment_distances(p1, q1, p2, q2):
+    """Return (distances, closest points on p1-q1, closest points on p2-q2) for paired segments given as (n, 3) end points."""
+    d1 = q1 - p1
+    d2 = q2 - p2
+    r = p1 - p2
+    a = np.einsum('ij,ij->i', d1, d1)
+    e = np.einsum('ij,ij->i', d2, d2)
+    b = np.einsum('ij,ij->i', d1, d2)
+    c = np.einsum('ij,ij->i', d1, r)
+    f = np.einsum('ij,ij->i', d2, r)
+    tiny = 1e-12
+    safe_a = np.where(a > tiny, a, 1.0)
+    safe_e = np.where(e > tiny, e, 1.0)
+    denom = a * e - b * b
+    skew = denom > tiny * a * e
+    # Closest point of the infinite lines clamped to segment 1 (its start for parallel segments),
+    # then the matching point on segment 2; when that falls outside, clamp it and re-project onto segment 1
+    s = np.where(skew, np.clip((b * f - c * e) / np.where(skew, denom, 1.0), 0.0, 1.0), 0.0)
+    t = (b * s + f) / safe_e
+    s = np.where(t < 0.0, np.clip(-c / safe_a, 0.0, 1.0), np.where(t > 1.0, np.clip((b - c) / safe_a, 0.0, 1.0), s))
+    t = np.clip(t, 0.0, 1.0)
+    # Zero-length segments are points
+    s = np.where(e > tiny, s, np.clip(-c / safe_a, 0.0, 1.0))
+    t = np.where(e > tiny, t, 0.0)
+    s = np.where(a > tiny, s, 0.0)
+    t = np.where(a > tiny, t, np.clip(f / safe_e, 0.0, 1.0))
+    points1 = p1 + d1 * s[:, None]
+    points2 = p2 + d2 * t[:, None]
+    return np.linalg.norm(points1 - points2, axis=1), points1, points2
+
+def closest_segment_pair(starts1, ends1, starts2, ends2, limit, axis=0):
+    """Return (distance, point on set 1, point on set 2) for the closest pair of segments from the two sets, or None if no pair is closer than limit.
+
+    Sweep along axis over the segments' boxes, measuring only pairs from different sets whose boxes are closer than
+    the best distance so far, which shrinks the sweep window as closer pairs are found.
+    """
+    count1 = len(starts1)
+    starts = np.concatenate((starts1, starts2))
+    ends = np.concatenate((ends1, ends2))
+    mins = np.minimum(starts, ends)
+    maxs = np.maximum(starts, ends)
+    order = np.argsort(mins[:, axis], kind='stable')
+    lefts = mins[order, axis]
+    rights = maxs[order, axis]
+    best = (limit, None, None)
+    active = np.arange(len(order) - 1)
+    offset = 1
+    while len(active):
+        # Sorted by left side, so once a candidate starts past the window every later one does too
+        active = active[lefts[active + offset] < rights[active] + best[0]]
+        first = order[active]
+        second = order[active + offset]
+        gaps = np.maximum(np.maximum(mins[second] - maxs[first], mins[first] - maxs[second]), 0.0)
+        close = ((first < count1) != (second < count1)) & (np.sqrt(np.square(gaps).sum(axis=1)) < best[0])
+        if close.any():
+            flip = first[close] >= count1
+            i = np.where(flip, second[close], first[close])
+            j = np.where(flip, first[close], second[close])
+            distances, points1, points2 = segment_distances(starts[i], ends[i], starts[j], ends[j])
+            k = int(np.argmin(distances))
+            if distances[k] < best[0]:
+                best = (float(distances[k]), points1[k], points2[k])
+        offset += 1
+        active = active[active + offset < len(order)]
+    return best if best[1] is not None else None
+
+def euler_xyz_matrices(rotations):
+    """Return (n, 3, 3) rotation matrices for (n, 3) XYZ Euler angles, matching Blender's rotation_mode 'XYZ'."""
+    cx, cy, cz = np.cos(rotations).T
+    sx, sy, sz = np.sin(rotations).T
+    matrices = np.empty((len(rotations), 3, 3))
+    matrices[:, 0, 0] = cy * cz
+    matrices[:, 0, 1] = sx * sy * cz - cx * sz
+    matrices[:, 0, 2] = cx * sy * cz + sx * sz
+    matrices[:, 1, 0] = cy * sz
+    matrices[:, 1, 1] = sx * sy * sz + cx * cz
+    matrices[:, 1, 2] = cx * sy * sz - sx * cz
+    matrices[:, 2, 0] = -sy
+    matrices[:, 2, 1] = sx * cy
+    matrices[:, 2, 2] = cx * cy
+    return matrices
+
+def animated_bounds(corners, location, rotation, scale):
+    """Return world-space (mins, maxs) per frame for fixed local corners (k, 3) and per-frame (f, 3) loc/rot/scale channels."""
+    basis = euler_xyz_matrices(rotation) * scale[:, None, :]
+    world = np.einsum('fij,kj->fki', basis, corners) + location[:, None, :]
+    return world.min(axis=1), world.max(axis=1)
+
+def solve_target_x(anchor_x, reference_x, distance, offset):
+    """Return the target X that sits distance + offset away from its anchor, moving away from the reference side the anchor is on."""
+    direction = 1 if anchor_x > reference_x else -1
+    return anchor_x + direction * (distance + offset)
+
+def solve_gap_secant(evaluate, x0, x1, goal, tolerance=1e-4, max_iterations=10, f0=None):
+    """Find x where evaluate(x) reaches goal using secant steps; return (x, gap, evaluations).
+
+    f0 is the gap already measured at x0, if any; it is used as-is and not counted as an evaluation.
+    """
+    evaluations = 0
+    if f0 is None:
+        f0 = evaluate(x0)
+        evaluations += 1
+    f0 -= goal
+    if abs(f0) <= tolerance:
+        return x0, f0 + goal, evaluations
+    f1 = evaluate(x1) - goal
+    evaluations += 1
+    while abs(f1) > tolerance and evaluations < max_iterations:
+        if f1 == f0:
+            # The target has no effect on the gap here; further steps cannot help
+            break
+        x0, x1 = x1, x1 - f1 * (x1 - x0) / (f1 - f0)
+        f0 = f1
+        f1 = evaluate(x1) - goal
+        evaluations += 1
+    return x1, f1 + goal, evaluations
+
+# Report export: rows are produced lazily and written in bulk, so memory stays flat however many pairs a scene has
+
+# Columns of an exported measurement row
+REPORT_FIELDS = ("object1", "object2", "mode", "gap_x", "gap_y", "gap_z", "separation", "overlap")
+# Rows measured together and written per bulk write
+EXPORT_BATCH_SIZE = 4096
+
+def iter_pair_chunks(pairs, size=EXPORT_BATCH_SIZE):
+    """Group an iterable of (i, j, ...) index pairs into (k, 2) arrays of at most size rows."""
+    chunk = []
+    for pair in pairs:
+        chunk.append(pair[:2])
+        if len(chunk) == size:
+            yield np.array(chunk, dtype=np.int64)
+            chunk = []
+    if chunk:
+        yield np.array(chunk, dtype=np.int64)
+
+def iter_bounds_rows(names, mins, maxs, pairs, mode='BOUNDS'):
+    """Yield REPORT_FIELDS rows for (i, j) index pairs into names and the boxes, measuring each chunk of pairs at once."""
+    for chunk in iter_pair_chunks(pairs):
+        first, second = chunk[:, 0], chunk[:, 1]
+        gaps, separation = gaps_from_bounds(mins[first], maxs[first], mins[second], maxs[second])
+        for i, j, gap, apart in zip(first.tolist(), second.tolist(), gaps.tolist(), separation.tolist()):
+            yield names[i], names[j], mode, gap[0], gap[1], gap[2], apart, apart <= 0.0
+
+def write_report(rows, path, file_format='CSV', batch_size=EXPORT_BATCH_SIZE):
+    """Stream REPORT_FIELDS rows to path as CSV or JSON Lines ('JSONL'), batch_size rows per write, and return the row count."""
+    buffer = io.StringIO()
+    if file_format == 'CSV':
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(REPORT_FIELDS)
+        write_row = writer.writerow
+    else:
+        # Only the strings need JSON escaping; float repr is already valid JSON, which avoids a dict and dumps call per row
+        template = "{" + ", ".join(f'"{field}": %s' for field in REPORT_FIELDS) + "}\n"
+
+        def write_row(row):
+            name1, name2, mode, *values, overlap = row
+            buffer.write(template % (json.dumps(name1), json.dumps(name2), json.dumps(mode), *map(repr, values), "true" if overlap else "false"))
+
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        for row in rows:
+            write_row(row)
+            count += 1
+            if count % batch_size == 0:
+                f.write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate()
+        f.write(buffer.getvalue())
+    return count
+
+# Parallel kernels
+
+def get_pool():
+    """Return the shared process pool, starting it on first use."""
+    if _pool["executor"] is None:
+        workers = max(1, (os.cpu_count() or 2) - 1)
+        # spawn keeps workers free of Blender's state; they only import this bpy-free module
+        _pool["executor"] = ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+    return _pool["executor"]
+
+def shutdown_pool():
+    """Stop the shared process pool, if it was started."""
+    executor = _pool["executor"]
+    _pool["executor"] = None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def _share(array):
+    """Copy array into a new shared memory block once and return the block."""
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+    return shm
+
+def _attach(name):
+    try:
+        # Python 3.13+: the creating process owns the block's lifetime
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+def _extent_task(name, shape, dtype, start, stop, row):
+    shm = _attach(name)
+    coords = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    values = coords[start:stop] @ np.asarray(row, dtype=dtype)
+    low, high = float(values.min()), float(values.max())
+    # Views into the block must be gone before it can be closed
+    del coords, values
+    shm.close()
+    return low, high, stop - start
+
+def _box_distance_task(name, out_name, shape, dtype, start, stop, box_min, box_max):
+    shm = _attach(name)
+    out_shm = _attach(out_name)
+    points = np.ndarray(shape, dtype=dtype, buffer=shm.buf)[start:stop]
+    out = np.ndarray((shape[0],), dtype=np.float64, buffer=out_shm.buf)
+    out[start:stop] = np.linalg.norm(np.maximum(np.maximum(box_min - points, points - box_max), 0.0), axis=1)
+    del points, out
+    shm.close()
+    out_shm.close()
+    return stop - start
+
+def _run_chunks(count, submit, cancel=None, progress=None):
+    """Submit one task per chunk of count rows and yield results as they complete; returns early if cancelled."""
+    executor = get_pool()
+    futures = [submit(executor, start, min(start + CHUNK_SIZE, count)) for start in range(0, count, CHUNK_SIZE)]
+    try:
+        for future in as_completed(futures):
+            if cancel is not None and cancel.is_set():
+                return
+            result = future.result()
+            if progress is not None:
+                progress(result[-1] if isinstance(result, tuple) else result)
+            yield result
+    finally:
+        for future in futures:
+            future.cancel()
+
+def projected_extent(coords, row, cancel=None, progress=None, threshold=PARALLEL_THRESHOLD):
+    """Return the (min, max) of coords projected onto a world matrix row, or None if cancelled.
+
+    Arrays of at least threshold rows are split into chunks reduced across the process pool through shared memory;
+    smaller ones are reduced in-process chunk by chunk.
+    """
+    axis = np.asarray(row[:3], dtype=coords.dtype)
+    low, high = np.inf, -np.inf
+    if len(coords) < threshold:
+        for start in range(0, len(coords), CHUNK_SIZE):
+            if cancel is not None and cancel.is_set():
+                return None
+            values = coords[start:start + CHUNK_SIZE] @ axis
+            low = min(low, float(values.min()))
+            high = max(high, float(values.max()))
+            if progress is not None:
+                progress(len(values))
+        return low + row[3], high + row[3]
+
+    coords = np.ascontiguousarray(coords)
+    shm = _share(coords)
+    try:
+        submit = lambda executor, start, stop: executor.submit(_extent_task, shm.name, coords.shape, coords.dtype.str, start, stop, axis)
+        for chunk_low, chunk_high, _count in _run_chunks(len(coords), submit, cancel, progress):
+            low = min(low, chunk_low)
+            high = max(high, chunk_high)
+        if cancel is not None and cancel.is_set():
+            return None
+    finally:
+        shm.close()
+        shm.unlink()
+    return low + row[3], high + row[3]
+
+def box_distances(points, box_min, box_max, threshold=PARALLEL_THRESHOLD):
+    """Return the distance from every point to the axis-aligned box (0 inside), splitting large arrays across the process pool."""
+    if len(points) < threshold:
+        return np.linalg.norm(np.maximum(np.maximum(box_min - points, points - box_max), 0.0), axis=1)
+
+    points = np.ascontiguousarray(points)
+    shm = _share(points)
+    out_shm = shared_memory.SharedMemory(create=True, size=len(points) * 8)
+    try:
+        submit = lambda executor, start, stop: executor.submit(
+            _box_distance_task, shm.name, out_shm.name, points.shape, points.dtype.str, start, stop, box_min, box_max)
+        for _count in _run_chunks(len(points), submit):
+            pass
+        return np.ndarray((len(points),), dtype=np.float64, buffer=out_shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+        out_shm.close()
+        out_shm.unlink()
@@ -0,0 +1,112 @@
+import json
+import logging
+import time
+from functools import wraps
+
+# Levels offered in the UI; OFF sits above CRITICAL so nothing is emitted until a user opts in
+LOG_LEVELS = {
+    'OFF': logging.CRITICAL + 10,
+    'ERROR': logging.ERROR,
+    'WARNING': logging.WARNING,
+    'INFO': logging.INFO,
+    'DEBUG': logging.DEBUG,
+}
+
+# Shared by every add-on in this repository; call with %-style arguments so messages are only formatted when emitted
+logger = logging.getLogger("distance_tools")
+logger.setLevel(LOG_LEVELS['OFF'])
+logger.propagate = False
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+    logger.addHandler(_handler)
+
+# Keys of warnings already emitted, so per-object warnings appear once instead of on every measurement
+_warned = set()
+# Operator timings keyed by name: [call count, total seconds, max seconds]
+_timings = {}
+
+def set_log_level(level):
+    """Set the shared logger to one of the LOG_LEVELS names."""
+    logger.setLevel(LOG_LEVELS[level])
+    _warned.clear()
+
+def warn_once(key, message, *args):
+    """Log a warning the first time key is seen, formatting message lazily."""
+    if key in _warned or not logger.isEnabledFor(logging.WARNING):
+        return
+    _warned.add(key)
+    logger.warning(message, *args)
+
+def record_timing(name, seconds):
+    """Add one call lasting seconds to the counters for name."""
+    entry = _timings.get(name)
+    if entry is None:
+        _timings[name] = [1, seconds, seconds]
+    else:
+        entry[0] += 1
+        entry[1] += seconds
+        if seconds > entry[2]:
+            entry[2] = seconds
+
+def timed(name):
+    """Decorator recording call count, total and max wall time of a function under name."""
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record_timing(name, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+def _timed_method(name, func, method):
+    """Wrap an operator method with the exact argument list Blender checks when the class is registered."""
+    if method == "execute":
+        @wraps(func)
+        def wrapper(self, context):
+            start = time.perf_counter()
+            try:
+                return func(self, context)
+            finally:
+                record_timing(name, time.perf_counter() - start)
+    else:
+        @wraps(func)
+        def wrapper(self, context, event):
+            start = time.perf_counter()
+            try:
+                return func(self, context, event)
+            finally:
+                record_timing(name, time.perf_counter() - start)
+    return wrapper
+
+def timed_operator(cls):
+    """Class decorator timing an operator's execute, invoke and modal methods under its bl_idname."""
+    for method in ("execute", "invoke", "modal"):
+        func = cls.__dict__.get(method)
+        if func is not None:
+            name = cls.bl_idname if method == "execute" else f"{cls.bl_idname} ({method})"
+            setattr(cls, method, _timed_method(name, func, method))
+    return cls
+
+def get_timings():
+    """Return the timing counters as a list of dicts sorted by total time, slowest first."""
+    rows = [
+        {"name": name, "count": count, "total": total, "max": peak, "mean": total / count}
+        for name, (count, total, peak) in _timings.items()
+    ]
+    rows.sort(key=lambda row: row["total"], reverse=True)
+    return rows
+
+def reset_timings():
+    """Clear every timing counter."""
+    _timings.clear()
+
+def export_timings(path):
+    """Write the timing counters to path as JSON and return the number of entries written."""
+    rows = get_timings()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "timings": rows}, f, indent=2)
+    return len(rows)
\ No newline at end of file